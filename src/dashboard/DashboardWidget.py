@@ -1,11 +1,16 @@
-from PyQt6.QtCore import pyqtSignal, QEvent
-from PyQt6.QtWidgets import QWidget
+import threading
+
+from PyQt6.QtCore import pyqtSignal, pyqtSlot, QEvent, QTimer, QSignalMapper
+from PyQt6.QtWidgets import QWidget, QSizePolicy
 
 from src.utils.utils_widgets.MaterialButton import MaterialButton
-from src.dashboard.widgets.ControlButtonsWidget import ControlButtonsWidget
-from src.dashboard.widgets.RobotTrajectoryWidget import RobotTrajectoryWidget
 from src.dashboard.config import DashboardConfig, ActionButtonConfig
 from src.dashboard.layout.layout_manager import DashboardLayoutManager
+from src.dashboard.resources.styles import DASHBOARD_STYLESHEET
+
+
+def _ignore(_value) -> None:
+    """Stand-in for a card setter the card widget does not implement."""
 
 
 class DashboardWidget(QWidget):
@@ -25,6 +30,9 @@ class DashboardWidget(QWidget):
     pause_requested = pyqtSignal()
     action_requested = pyqtSignal(str)  # emits action_id
 
+    # Arms the point flush timer in the GUI thread when points arrive from another thread
+    _flush_requested = pyqtSignal()
+
     def __init__(
         self,
         config: DashboardConfig = None,
@@ -36,39 +44,63 @@ class DashboardWidget(QWidget):
         self.config = config or DashboardConfig()
         self._action_button_configs: list[ActionButtonConfig] = action_buttons or []
         self._action_buttons: dict[str, MaterialButton] = {}
-        self._cards_input: list[tuple] = cards or []  # (widget, card_id, row, col)
+        self._cards_input: list[tuple] = list(cards or [])  # (widget, card_id, row, col)
         self._cards: dict[int, QWidget] = {}          # card_id → widget
+        self._card_setters: dict[int, tuple] = {}     # card_id → (set_weight, set_state, set_glue_type)
+        self._card_entries: list[tuple] = []          # (widget, row, col) as handed to the layout manager
         self.init_ui()
 
     # ------------------------------------------------------------------ #
     #  Typed setter API (called by DashboardAdapter)                      #
     # ------------------------------------------------------------------ #
 
+    # Setters that take values are not typed @pyqtSlots on purpose: PyQt
+    # refuses to connect a typed slot to any signal whose signature differs,
+    # and adapters send these payloads loosely typed (object, int grams, ...).
+    # The argument-less @pyqtSlot() setters still accept any signal.
+
     def set_cell_weight(self, card_id: int, grams: float) -> None:
-        if card := self._cards.get(card_id):
-            card.set_weight(grams)
+        """Show *grams* on card *card_id*; connectable from any (int, value) signal."""
+        if setters := self._card_setters.get(card_id):
+            setters[0](grams)
 
     def set_cell_state(self, card_id: int, state: str) -> None:
-        if card := self._cards.get(card_id):
-            card.set_state(state)
+        """Show *state* on card *card_id*; connectable from any (int, value) signal."""
+        if setters := self._card_setters.get(card_id):
+            setters[1](state)
 
     def set_cell_glue_type(self, card_id: int, glue_type: str) -> None:
-        if card := self._cards.get(card_id):
-            card.set_glue_type(glue_type)
+        """Show *glue_type* on card *card_id*; connectable from any (int, value) signal."""
+        if setters := self._card_setters.get(card_id):
+            setters[2](glue_type)
 
     def set_trajectory_image(self, image) -> None:
+        self._flush_points()
         self.trajectory_widget.set_image(image)
 
     def update_trajectory_point(self, point) -> None:
-        self.trajectory_widget.update_trajectory_point(point)
-
+        # Points are buffered and handed to the trajectory widget at most
+        # once per display frame, however fast the producer sends them.
+        # Callable from any thread.
+        with self._point_lock:
+            self._point_buffer.append(point)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        self._flush_requested.emit()
+
+    @pyqtSlot()
     def break_trajectory(self, _=None) -> None:
+        self._flush_points()
         self.trajectory_widget.break_trajectory()
 
+    @pyqtSlot()
     def enable_trajectory_drawing(self, _=None) -> None:
         self.trajectory_widget.enable_drawing()
 
+    @pyqtSlot()
     def disable_trajectory_drawing(self, _=None) -> None:
+        self._flush_points()
         self.trajectory_widget.disable_drawing()
 
     def set_start_enabled(self, enabled: bool) -> None:
@@ -91,11 +123,25 @@ class DashboardWidget(QWidget):
         if btn := self._action_buttons.get(action_id):
             btn.setText(text)
 
+    def add_card(self, widget: QWidget, card_id: int,
+                 row: int | None = None, col: int | None = None) -> None:
+        """Register a card after construction; only the card grid is rebuilt."""
+        self._cards_input.append((widget, card_id, row, col))
+        self._card_entries.append(self._register_card(widget, card_id, row, col))
+        self.layout_manager.set_glue_cards(self._card_entries)
+        self.layout_manager.update_layout()
+
     # ------------------------------------------------------------------ #
     #  UI initialisation                                                   #
     # ------------------------------------------------------------------ #
 
     def init_ui(self):
+        # Imported here so that importing this module does not pull in
+        # numpy/OpenCV until a dashboard is actually built.
+        from src.dashboard.widgets.ControlButtonsWidget import ControlButtonsWidget
+        from src.dashboard.widgets.RobotTrajectoryWidget import RobotTrajectoryWidget
+
+        self.setStyleSheet(DASHBOARD_STYLESHEET)
         self.layout_manager = DashboardLayoutManager(self, self.config)
 
         self.trajectory_widget = RobotTrajectoryWidget(
@@ -105,10 +151,23 @@ class DashboardWidget(QWidget):
             trail_length=self.config.trajectory_trail_length,
         )
 
+        self._point_buffer: list = []
+        self._point_lock = threading.Lock()
+        self._flush_scheduled = False
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.config.display_fps_ms)
+        self._flush_timer.timeout.connect(self._flush_points)
+        self._flush_requested.connect(self._start_flush_timer)
+
         self.control_buttons = ControlButtonsWidget()
-        self.control_buttons.start_clicked.connect(self.start_requested.emit)
-        self.control_buttons.stop_clicked.connect(self.stop_requested.emit)
-        self.control_buttons.pause_clicked.connect(self.pause_requested.emit)
+        self.control_buttons.start_clicked.connect(self.start_requested)
+        self.control_buttons.stop_clicked.connect(self.stop_requested)
+        self.control_buttons.pause_clicked.connect(self.pause_requested)
+
+        # One mapper routes every action button's click to action_requested(action_id)
+        self._action_mapper = QSignalMapper(self)
+        self._action_mapper.mappedString.connect(self.action_requested)
 
         action_widgets = self._prepare_action_buttons()
         card_widgets = self._register_cards()
@@ -120,25 +179,52 @@ class DashboardWidget(QWidget):
             action_widgets,
         )
 
+    @pyqtSlot()
+    def _start_flush_timer(self) -> None:
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_points(self) -> None:
+        """Hand all buffered trajectory points to the trajectory widget in arrival order."""
+        with self._point_lock:
+            batch, self._point_buffer = self._point_buffer, []
+            self._flush_scheduled = False
+        if batch:
+            self.trajectory_widget.update_trajectory_points(batch)
+
     def _prepare_action_buttons(self) -> list:
         """Build action buttons from config; return (widget, row, col, row_span, col_span) tuples."""
         result = []
         for cfg in self._action_button_configs:
             btn = MaterialButton(cfg.label, font_size=cfg.font_size)
             btn.setEnabled(cfg.enabled)
+            btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
             action_id = cfg.action_id
-            btn.clicked.connect(lambda _=False, aid=action_id: self.action_requested.emit(aid))
+            btn.clicked.connect(self._action_mapper.map)
+            self._action_mapper.setMapping(btn, action_id)
             self._action_buttons[action_id] = btn
             result.append((btn, cfg.row, cfg.col, cfg.row_span, cfg.col_span))
         return result
 
     def _register_cards(self) -> list:
-        """Store card_id→widget mapping; return (widget, row, col) tuples for layout manager."""
-        result = []
-        for (widget, card_id, row, col) in self._cards_input:
-            self._cards[card_id] = widget
-            result.append((widget, row, col))
-        return result
+        """Register every input card; return (widget, row, col) tuples for layout manager."""
+        self._card_entries = [self._register_card(*entry) for entry in self._cards_input]
+        return self._card_entries
+
+    def _register_card(self, widget: QWidget, card_id: int, row, col) -> tuple:
+        """Store card_id→widget mapping and the card's bound setters; return its layout entry.
+
+        Sizing is applied here, once per card, so relayouts don't repeat it.
+        """
+        widget.setMinimumHeight(self.config.card_min_height)
+        widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self._cards[card_id] = widget
+        self._card_setters[card_id] = (
+            getattr(widget, "set_weight", _ignore),
+            getattr(widget, "set_state", _ignore),
+            getattr(widget, "set_glue_type", _ignore),
+        )
+        return widget, row, col
 
     # ------------------------------------------------------------------ #
     #  Cleanup                                                             #
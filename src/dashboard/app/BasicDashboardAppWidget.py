@@ -15,7 +15,9 @@ class BasicDashboardAppWidget(AppWidget):
     Responsibilities:
       - Builds and owns DashboardWidget internally
       - Re-emits DashboardWidget signals as its own public API
-      - Exposes setter methods that the adapter calls to update the UI
+      - Exposes the DashboardWidget setters the adapter calls to update the UI
+        (``_FORWARDED_SETTERS``), bound on the instance in ``setup_ui``; a
+        subclass may override any of them with its own method
       - Forwards Qt LanguageChange to retranslateUi()
 
     Has zero knowledge of any adapter, container, or backend.
@@ -47,57 +49,41 @@ class BasicDashboardAppWidget(AppWidget):
         self._dashboard = DashboardWidget()
         layout.addWidget(self._dashboard)
 
-        # Re-emit dashboard signals as this widget's own public signals
-        self._dashboard.start_requested.connect(self.start_requested.emit)
-        self._dashboard.stop_requested.connect(self.stop_requested.emit)
-        self._dashboard.pause_requested.connect(self.pause_requested.emit)
-        self._dashboard.action_requested.connect(self.action_requested.emit)
+        # Chain dashboard signals straight into this widget's public signals
+        # (signal→signal, so no Python emit() runs per user action)
+        self._dashboard.start_requested.connect(self.start_requested)
+        self._dashboard.stop_requested.connect(self.stop_requested)
+        self._dashboard.pause_requested.connect(self.pause_requested)
+        self._dashboard.action_requested.connect(self.action_requested)
+
+        # Bind the setter API straight to the dashboard's methods, so a call
+        # from the adapter runs without a forwarding frame. Names a subclass
+        # defines itself are left alone.
+        for name in self._FORWARDED_SETTERS:
+            if not hasattr(type(self), name):
+                setattr(self, name, getattr(self._dashboard, name))
 
     # ------------------------------------------------------------------ #
     #  Setter API — called exclusively by the adapter                     #
     # ------------------------------------------------------------------ #
 
-    def set_cell_weight(self, card_id: int, grams: float) -> None:
-        self._dashboard.set_cell_weight(card_id, grams)
-
-    def set_cell_state(self, card_id: int, state: str) -> None:
-        self._dashboard.set_cell_state(card_id, state)
-
-    def set_cell_glue_type(self, card_id: int, glue_type: str) -> None:
-        self._dashboard.set_cell_glue_type(card_id, glue_type)
-
-    def set_trajectory_image(self, image) -> None:
-        self._dashboard.set_trajectory_image(image)
-
-    def update_trajectory_point(self, point) -> None:
-        self._dashboard.update_trajectory_point(point)
-
-    def break_trajectory(self, _=None) -> None:
-        self._dashboard.break_trajectory()
-
-    def enable_trajectory_drawing(self, _=None) -> None:
-        self._dashboard.enable_trajectory_drawing()
-
-    def disable_trajectory_drawing(self, _=None) -> None:
-        self._dashboard.disable_trajectory_drawing()
-
-    def set_start_enabled(self, enabled: bool) -> None:
-        self._dashboard.set_start_enabled(enabled)
-
-    def set_stop_enabled(self, enabled: bool) -> None:
-        self._dashboard.set_stop_enabled(enabled)
-
-    def set_pause_enabled(self, enabled: bool) -> None:
-        self._dashboard.set_pause_enabled(enabled)
-
-    def set_pause_text(self, text: str) -> None:
-        self._dashboard.set_pause_text(text)
-
-    def set_action_button_text(self, action_id: str, text: str) -> None:
-        self._dashboard.set_action_button_text(action_id, text)
-
-    def set_action_button_enabled(self, action_id: str, enabled: bool) -> None:
-        self._dashboard.set_action_button_enabled(action_id, enabled)
+    # DashboardWidget setters exposed on this widget (bound in setup_ui)
+    _FORWARDED_SETTERS = (
+        "set_cell_weight",
+        "set_cell_state",
+        "set_cell_glue_type",
+        "set_trajectory_image",
+        "update_trajectory_point",
+        "break_trajectory",
+        "enable_trajectory_drawing",
+        "disable_trajectory_drawing",
+        "set_start_enabled",
+        "set_stop_enabled",
+        "set_pause_enabled",
+        "set_pause_text",
+        "set_action_button_text",
+        "set_action_button_enabled",
+    )
 
     def get_card(self, card_id: int):
         """Return the card widget for *card_id* (used by adapter for sub-signals)."""
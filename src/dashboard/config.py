@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DashboardConfig:
     trajectory_width: int = 800
     trajectory_height: int = 450
@@ -19,7 +19,7 @@ class DashboardConfig:
     preview_aux_cols: int = 3
     show_placeholders: bool = True
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ActionButtonConfig:
     action_id: str
     label: str
@@ -31,7 +31,7 @@ class ActionButtonConfig:
     col_span: int = 1
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CardConfig:
     card_id: int
     label: str
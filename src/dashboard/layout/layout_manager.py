@@ -1,82 +1,246 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-                             QLabel, QFrame, QSizePolicy)
-from PyQt6.QtCore import Qt
+                             QSizePolicy, QSpacerItem)
+from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen, QPixmap
 from typing import List
 
 from src.utils.utils_widgets.MaterialButton import MaterialButton
 
 try:
-    from src.dashboard.resources.styles import BORDER, SLOT_PLACEHOLDER_STYLE
+    from src.dashboard.resources.styles import PRIMARY, BORDER
 except ImportError:
     try:
-        from dashboard.styles import BORDER, SLOT_PLACEHOLDER_STYLE
+        from dashboard.styles import PRIMARY, BORDER
     except ImportError:
+        PRIMARY = "#7A5AF8"
         BORDER = "#E4E6F0"
-        SLOT_PLACEHOLDER_STYLE = "QFrame { border: 2px dashed #E4E6F0; border-radius: 12px; }"
+
+
+_ALIGN_TOPLEFT = Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+
+_placeholder_fonts: dict[int, QFont] = {}
+
+
+def _placeholder_font(pixel_size: int) -> QFont:
+    """Return the shared placeholder font for *pixel_size* (QFont is implicitly shared)."""
+    font = _placeholder_fonts.get(pixel_size)
+    if font is None:
+        font = QFont()
+        font.setPixelSize(pixel_size)
+        font.setWeight(QFont.Weight.Light)
+        _placeholder_fonts[pixel_size] = font
+    return font
+
+
+def _placeholder_text(config_type: str, row: int, col: int) -> str:
+    return f"Configure Via\n{config_type}\nrow={row} col={col}"
+
+
+class _PlaceholderCell(QSpacerItem):
+    """Spacer reserving a grid cell for a painted placeholder.
+
+    Reports itself as non-empty so the grid keeps its spacing around it,
+    as it would around a placeholder widget.
+    """
+
+    def isEmpty(self) -> bool:
+        return False
+
+
+class _PlaceholderGrid(QWidget):
+    """Grid container that paints its empty cells as slot placeholders.
+
+    An empty cell holds a QSpacerItem sized to fit its placeholder text, and
+    the dashed tiles are drawn by the container at the cells' layout rects,
+    so a placeholder costs no widget of its own. The tiles are rendered into
+    a pixmap that is reused until the cell geometry changes.
+    """
+
+    _PADDING = 10
+    _BORDER_WIDTH = 2
+    _RADIUS = 12
+
+    def __init__(self, spacing: int, margin: int = 0, parent=None):
+        super().__init__(parent)
+        self.grid = QGridLayout(self)
+        self.grid.setSpacing(spacing)
+        self.grid.setContentsMargins(margin, margin, margin, margin)
+        self._font = _placeholder_font(11)
+        self._placeholders: list[tuple[int, int, str]] = []
+        self._pixmap: QPixmap | None = None
+        self._pixmap_key = None
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+
+    def add_placeholder(self, config_type: str, row: int, col: int) -> None:
+        """Reserve cell (*row*, *col*) for a painted placeholder."""
+        text = _placeholder_text(config_type, row, col)
+        lines = text.split("\n")
+        metrics = QFontMetrics(self._font)
+        inset = 2 * (self._PADDING + self._BORDER_WIDTH)
+        width = max(metrics.horizontalAdvance(line) for line in lines) + inset
+        height = len(lines) * metrics.lineSpacing() + inset
+        self.grid.addItem(_PlaceholderCell(width, height, QSizePolicy.Policy.MinimumExpanding,
+                                           QSizePolicy.Policy.MinimumExpanding), row, col)
+        self._placeholders.append((row, col, text))
+        self._pixmap = None
+
+    def paintEvent(self, event) -> None:
+        if not self._placeholders:
+            return
+        rects = [QRectF(self.grid.cellRect(r, c)) for r, c, _ in self._placeholders]
+        key = (self.width(), self.height(), tuple(rect.getRect() for rect in rects))
+        if self._pixmap is None or key != self._pixmap_key:
+            self._pixmap = self._render_tiles(rects)
+            self._pixmap_key = key
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._pixmap)
+        painter.end()
+
+    def _render_tiles(self, rects: list[QRectF]) -> QPixmap:
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        fill = QColor(PRIMARY)
+        fill.setAlphaF(0.05)
+        pen = QPen(QColor(BORDER), self._BORDER_WIDTH, Qt.PenStyle.DashLine)
+        half_pen = self._BORDER_WIDTH / 2
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(self._font)
+        for rect, (_, _, text) in zip(rects, self._placeholders):
+            painter.setPen(pen)
+            painter.setBrush(fill)
+            painter.drawRoundedRect(rect.adjusted(half_pen, half_pen, -half_pen, -half_pen),
+                                    self._RADIUS, self._RADIUS)
+            painter.setPen(QColor("#000000"))
+            painter.drawText(rect, _ALIGN_CENTER, text)
+        painter.end()
+        return pixmap
 
 
 class DashboardLayoutManager:
+    # section name → (container attribute, builder method, builder input attribute)
+    _SECTIONS = {
+        "preview": ("_preview_container", "_create_preview_container", "_trajectory_widget"),
+        "cards":   ("_cards_container", "_create_glue_cards_container", "_glue_cards"),
+        "actions": ("_action_container", "_create_action_grid", "_action_buttons"),
+    }
+    _COLUMN_STRETCH = (2, 1)
+
     def __init__(self, parent_widget: QWidget, config):
         self.parent = parent_widget
         self.config = config
-        self.main_layout = QVBoxLayout(parent_widget)
-        self.main_layout.setSpacing(15)
+        # One grid holds the sections: preview and cards on the top row, and
+        # the fixed-height bottom row spanning both columns.
+        self.main_layout = QGridLayout(parent_widget)
+        self.main_layout.setHorizontalSpacing(10)
+        self.main_layout.setVerticalSpacing(15)
         self.main_layout.setContentsMargins(10, 10, 10, 10)
 
+        # Built section containers and their inputs, kept so that a later
+        # change only rebuilds the section it affects.
+        self._preview_container: QWidget | None = None
+        self._cards_container: QWidget | None = None
+        self._action_container: QWidget | None = None
+        self._trajectory_widget = None
+        self._glue_cards: list = []
+        self._action_buttons: list = []
+        self._dirty: set[str] = set()
+
     def setup_complete_layout(self, trajectory_widget, glue_cards: List[QWidget],
                               control_buttons: QWidget,
                               action_buttons: List[MaterialButton]) -> None:
-        top_section = self._create_top_section(trajectory_widget, glue_cards)
-        bottom_section = self._create_bottom_section(control_buttons, action_buttons)
+        self._trajectory_widget = trajectory_widget
+        self._glue_cards = list(glue_cards)
+        self._action_buttons = list(action_buttons)
+
+        self._preview_container = self._create_preview_container(trajectory_widget)
+        self._cards_container = self._create_glue_cards_container(glue_cards)
+        self._action_container = self._create_action_grid(action_buttons)
+
+        # The bottom row has its own 1:1 split: the cards' width cap only
+        # shapes the top row, so actions and controls stay equal at any width.
+        control_buttons.setFixedHeight(self.config.bottom_section_height)
+        bottom_row = QHBoxLayout()
+        bottom_row.setSpacing(15)
+        bottom_row.addWidget(self._action_container, stretch=1)
+        bottom_row.addWidget(control_buttons, stretch=1)
+
+        grid = self.main_layout
+        grid.addWidget(self._preview_container, 0, 0)
+        grid.addWidget(self._cards_container, 0, 1)
+        grid.addLayout(bottom_row, 1, 0, 1, 2)
+        for col, stretch in enumerate(self._COLUMN_STRETCH):
+            grid.setColumnStretch(col, stretch)
+        grid.setRowStretch(0, 1)
+        grid.setRowStretch(1, 0)
+        self._dirty.clear()
 
-        bottom_container = QWidget()
-        bottom_container.setFixedHeight(self.config.bottom_section_height)
-        bottom_container.setLayout(bottom_section)
+    # ------------------------------------------------------------------ #
+    #  Incremental relayout                                                #
+    # ------------------------------------------------------------------ #
 
-        self.main_layout.addLayout(top_section, stretch=1)
-        self.main_layout.addWidget(bottom_container)
+    def set_glue_cards(self, glue_cards: list) -> None:
+        """Replace the card entries; only the card grid is marked for rebuild."""
+        self._glue_cards = list(glue_cards)
+        self.invalidate("cards")
+
+    def set_action_buttons(self, action_buttons: list) -> None:
+        """Replace the action button entries; only the action grid is marked for rebuild."""
+        self._action_buttons = list(action_buttons)
+        self.invalidate("actions")
+
+    def invalidate(self, section: str) -> None:
+        """Mark *section* (``"preview"``, ``"cards"`` or ``"actions"``) for rebuild on the next ``update_layout``."""
+        if section not in self._SECTIONS:
+            raise ValueError(f"Unknown layout section: {section!r}")
+        self._dirty.add(section)
+
+    def update_layout(self) -> None:
+        """Rebuild the sections invalidated since the last pass; clean sections are reused as-is."""
+        for section in [name for name in self._SECTIONS if name in self._dirty]:
+            container_attr, builder_name, input_attr = self._SECTIONS[section]
+            old = getattr(self, container_attr)
+            # Building the new container reparents the reused input widgets
+            # into it, so deleting the old one only drops its placeholders.
+            new = getattr(self, builder_name)(getattr(self, input_attr))
+            if old is not None:
+                old.parentWidget().layout().replaceWidget(old, new)
+                old.hide()
+                old.deleteLater()
+            setattr(self, container_attr, new)
+        self._dirty.clear()
 
     # ------------------------------------------------------------------ #
-    #  Top section                                                         #
+    #  Top row                                                             #
     # ------------------------------------------------------------------ #
 
-    def _create_top_section(self, trajectory_widget, glue_cards: List[QWidget]) -> QHBoxLayout:
-        top_section = QHBoxLayout()
-        top_section.setSpacing(10)
-        top_section.addWidget(self._create_preview_container(trajectory_widget), stretch=2)
-        top_section.addWidget(self._create_glue_cards_container(glue_cards), stretch=1)
-        return top_section
-
     def _create_preview_container(self, trajectory_widget) -> QWidget:
         preview_widget = QWidget()
         preview_layout = QVBoxLayout(preview_widget)
         preview_layout.setContentsMargins(0, 0, 0, 0)
         preview_layout.setSpacing(10)
-        preview_layout.addWidget(trajectory_widget, alignment=Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+        preview_layout.addWidget(trajectory_widget, alignment=_ALIGN_TOPLEFT)
         preview_layout.addWidget(self._create_preview_aux_grid(), stretch=1)
         return preview_widget
 
     def _create_preview_aux_grid(self) -> QWidget:
         """Placeholder grid that fills the space below the trajectory widget."""
-        rows = self.config.preview_aux_rows
-        cols = self.config.preview_aux_cols
+        if self.config.show_placeholders:
+            container = _PlaceholderGrid(spacing=10)
+            for r in range(self.config.preview_aux_rows):
+                container.grid.setRowStretch(r, 1)
+                for c in range(self.config.preview_aux_cols):
+                    container.grid.setColumnStretch(c, 1)
+                    container.add_placeholder("PreviewAux", r, c)
+            return container
 
         container = QWidget()
         container.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        grid = QGridLayout(container)
-        grid.setSpacing(10)
-        grid.setContentsMargins(0, 0, 0, 0)
-
-        for r in range(rows):
-            grid.setRowStretch(r, 1)
-        for c in range(cols):
-            grid.setColumnStretch(c, 1)
-
-        if self.config.show_placeholders:
-            for idx in range(rows * cols):
-                r, c = divmod(idx, cols)
-                grid.addWidget(self._create_placeholder("PreviewAux", r, c), r, c)
-
         return container
 
     def _create_glue_cards_container(self, cards: list) -> QWidget:
@@ -84,16 +248,14 @@ class DashboardLayoutManager:
 
         Each entry is a ``(widget, row_or_None, col_or_None)`` tuple.
         Explicit positions are placed first; remaining cards auto-fill in
-        row-major order; empty cells become placeholders.
+        row-major order; empty cells become painted placeholders. Card sizing is
+        applied once by ``DashboardWidget._register_card``, not per layout pass.
         """
         rows = self.config.card_grid_rows
         cols = self.config.card_grid_cols
 
-        container = QWidget()
-        container.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        grid = QGridLayout(container)
-        grid.setSpacing(8)
-        grid.setContentsMargins(0, 0, 0, 0)
+        container = _PlaceholderGrid(spacing=8)
+        grid = container.grid
 
         for r in range(rows):
             grid.setRowStretch(r, 1)
@@ -106,8 +268,6 @@ class DashboardLayoutManager:
         auto_queue = []
         for entry in cards:
             widget, card_row, card_col = entry
-            widget.setMinimumHeight(self.config.card_min_height)
-            widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
             if card_row is not None and card_col is not None:
                 grid.addWidget(widget, card_row, card_col)
                 occupied.add((card_row, card_col))
@@ -125,24 +285,16 @@ class DashboardLayoutManager:
             if auto_queue:
                 grid.addWidget(auto_queue.pop(0), r, c)
             elif self.config.show_placeholders:
-                grid.addWidget(self._create_placeholder("CardConfig", r, c), r, c)
+                container.add_placeholder("CardConfig", r, c)
 
         container.setMinimumWidth(self.config.card_grid_min_width)
         container.setMaximumWidth(self.config.card_grid_max_width)
         return container
 
     # ------------------------------------------------------------------ #
-    #  Bottom section                                                      #
+    #  Bottom row                                                          #
     # ------------------------------------------------------------------ #
 
-    def _create_bottom_section(self, control_buttons: QWidget,
-                               action_buttons: List[MaterialButton]) -> QHBoxLayout:
-        bottom_section = QHBoxLayout()
-        bottom_section.setSpacing(15)
-        bottom_section.addWidget(self._create_action_grid(action_buttons), stretch=1)
-        bottom_section.addWidget(control_buttons, stretch=1)
-        return bottom_section
-
     def _create_action_grid(self, action_buttons: list) -> QWidget:
         """Place action buttons in a rows×cols grid where every cell is the same size.
 
@@ -151,16 +303,14 @@ class DashboardLayoutManager:
 
         * Buttons with explicit (row, col) are placed first with their span values.
         * Buttons without a position are placed in the next available cell with their span.
-        * Empty cells are filled with styled placeholder frames.
+        * Empty cells are reserved as painted placeholders.
         """
         rows = self.config.action_grid_rows
         cols = self.config.action_grid_cols
 
-        container = QWidget()
-        container.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        grid = QGridLayout(container)
-        grid.setSpacing(10)
-        grid.setContentsMargins(5, 5, 5, 5)
+        container = _PlaceholderGrid(spacing=10, margin=5)
+        container.setFixedHeight(self.config.bottom_section_height)
+        grid = container.grid
 
         for r in range(rows):
             grid.setRowStretch(r, 1)
@@ -180,71 +330,40 @@ class DashboardLayoutManager:
         auto_queue = []
         for entry in action_buttons:
             widget, btn_row, btn_col, row_span, col_span = entry
-            widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
             if btn_row is not None and btn_col is not None:
                 grid.addWidget(widget, btn_row, btn_col, row_span, col_span)
                 mark_occupied(btn_row, btn_col, row_span, col_span)
             else:
                 auto_queue.append((widget, row_span, col_span))
 
-        # Pass 2 — auto-fill remaining buttons into free cells (row-major)
-        def find_free_cell(needed_row_span: int, needed_col_span: int):
-            """Find the first cell where a widget of given span fits."""
-            for r in range(rows):
-                for c in range(cols):
-                    # Check if the top-left cell is free
-                    if (r, c) in occupied:
-                        continue
-                    # Check if all cells in the span are free
-                    can_fit = True
-                    for dr in range(needed_row_span):
-                        for dc in range(needed_col_span):
-                            if r + dr >= rows or c + dc >= cols or (r + dr, c + dc) in occupied:
-                                can_fit = False
-                                break
-                        if not can_fit:
-                            break
-                    if can_fit:
-                        return r, c
-            return None
+        # Pass 2 — auto-fill remaining buttons into free cells (row-major).
+        # Free cells are listed once; the cursor skips cells taken by earlier
+        # placements so each search only scans forward from the first gap.
+        free_cells = [(r, c) for r in range(rows) for c in range(cols) if (r, c) not in occupied]
+        cursor = 0
+
+        def fits(r: int, c: int, row_span: int, col_span: int) -> bool:
+            """Check that a widget with the given span fits with (r, c) as its top-left cell."""
+            if r + row_span > rows or c + col_span > cols:
+                return False
+            return all((r + dr, c + dc) not in occupied
+                       for dr in range(row_span) for dc in range(col_span))
 
         for widget, row_span, col_span in auto_queue:
-            cell = find_free_cell(row_span, col_span)
-            if cell:
-                r, c = cell
-                grid.addWidget(widget, r, c, row_span, col_span)
-                mark_occupied(r, c, row_span, col_span)
+            while cursor < len(free_cells) and free_cells[cursor] in occupied:
+                cursor += 1
+            for i in range(cursor, len(free_cells)):
+                r, c = free_cells[i]
+                if (r, c) not in occupied and fits(r, c, row_span, col_span):
+                    grid.addWidget(widget, r, c, row_span, col_span)
+                    mark_occupied(r, c, row_span, col_span)
+                    break
 
         # Pass 3 — fill empty cells with placeholders
         if self.config.show_placeholders:
-            for r in range(rows):
-                for c in range(cols):
-                    if (r, c) not in occupied:
-                        grid.addWidget(self._create_placeholder("ActionButtonConfig", r, c), r, c)
-                        occupied.add((r, c))
+            for r, c in free_cells:
+                if (r, c) not in occupied:
+                    container.add_placeholder("ActionButtonConfig", r, c)
+                    occupied.add((r, c))
 
         return container
-
-    def _create_placeholder(self, config_type: str = "", row: int = 0, col: int = 0) -> QFrame:
-        placeholder_frame = QFrame()
-        placeholder_frame.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        placeholder_frame.setStyleSheet(SLOT_PLACEHOLDER_STYLE)
-
-        layout = QVBoxLayout(placeholder_frame)
-        layout.setContentsMargins(10, 10, 10, 10)
-
-        if config_type:
-            text = f"Configure Via\n{config_type}\nrow={row} col={col}"
-            font_size = 11
-        else:
-            text = "+"
-            font_size = 28
-
-        label = QLabel(text)
-        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        label.setStyleSheet(
-            f"color: #000000; font-size: {font_size}px; font-weight: 300; border: none; background: transparent;"
-        )
-        layout.addWidget(label)
-
-        return placeholder_frame
\ No newline at end of file
@@ -222,8 +222,11 @@ border: none;
 padding: 4px 0px;
 """
 
+IMAGE_LABEL_NAME = "trajectoryImage"
+CONTAINER_FRAME_NAME = "trajectoryContainer"
+
 IMAGE_LABEL_STYLE = f"""
-QLabel {{
+QLabel#{IMAGE_LABEL_NAME} {{
     background-color: {BG_COLOR};
     border-radius: 6px;
     border: 1px solid {BORDER};
@@ -231,27 +234,19 @@ QLabel {{
 """
 
 CONTAINER_FRAME_STYLE = f"""
-QFrame {{
+QFrame#{CONTAINER_FRAME_NAME} {{
     background-color: white;
     border-radius: 8px;
     border: 1px solid {BORDER};
 }}
 """
 
-SLOT_PLACEHOLDER_STYLE = f"""
-QFrame {{
-    background-color: {GROUP_BG};
-    border: 2px dashed {BORDER};
-    border-radius: 12px;
-}}
-"""
+# Every dashboard rule is scoped by object name, so the whole sheet is set
+# once on the DashboardWidget and parsed once instead of per child widget.
+DASHBOARD_STYLESHEET = IMAGE_LABEL_STYLE + CONTAINER_FRAME_STYLE
 
 WIZARD_IMAGE_PLACEHOLDER_STYLE = f"""
-QLabel {{
-    background-color: {BG_COLOR};
-    border: 2px dashed {BORDER};
-    border-radius: 8px;
-}}
+background-color: {BG_COLOR}; border: 2px dashed {BORDER}; border-radius: 8px;
 """
 
 WIZARD_WARNING_LABEL_STYLE = f"""
@@ -14,6 +14,9 @@ class ControlButtonsWidget(QWidget):
     stop_clicked = pyqtSignal()
     pause_clicked = pyqtSignal()
 
+    # (button attribute, source text) pairs labelled by retranslateUi()
+    _LABELS = (("start_btn", "Start"), ("stop_btn", "Stop"), ("pause_btn", "Pause"))
+
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self.init_ui()
@@ -45,9 +48,10 @@ class ControlButtonsWidget(QWidget):
         top_frame, top_layout = self._create_frame_with_layout()
         bottom_frame, bottom_layout = self._create_frame_with_layout()
 
-        self.start_btn = self._create_button(text=self.tr("Start"))
-        self.stop_btn  = self._create_button(text=self.tr("Stop"))
-        self.pause_btn = self._create_button(text=self.tr("Pause"))
+        self.start_btn = self._create_button()
+        self.stop_btn  = self._create_button()
+        self.pause_btn = self._create_button()
+        self.retranslateUi()
 
         top_layout.addWidget(self.start_btn)
         top_layout.addWidget(self.pause_btn)
@@ -61,14 +65,18 @@ class ControlButtonsWidget(QWidget):
     # ------------------------------------------------------------------ #
 
     def connect_signals(self) -> None:
-        self.start_btn.clicked.connect(self.start_clicked.emit)
-        self.stop_btn.clicked.connect(self.stop_clicked.emit)
-        self.pause_btn.clicked.connect(self.pause_clicked.emit)
+        # Signal-to-signal connections are forwarded by Qt without a Python slot
+        self.start_btn.clicked.connect(self.start_clicked)
+        self.stop_btn.clicked.connect(self.stop_clicked)
+        self.pause_btn.clicked.connect(self.pause_clicked)
 
     # ------------------------------------------------------------------ #
     #  Public setter API — called by the adapter                          #
     # ------------------------------------------------------------------ #
 
+    # Plain methods rather than typed @pyqtSlots, so the adapter can connect
+    # signals of any payload type (object, int, ...) to them.
+
     def set_start_enabled(self, enabled: bool) -> None:
         self.start_btn.setEnabled(enabled)
 
@@ -86,9 +94,8 @@ class ControlButtonsWidget(QWidget):
     # ------------------------------------------------------------------ #
 
     def retranslateUi(self) -> None:
-        self.start_btn.setText(self.tr("Start"))
-        self.stop_btn.setText(self.tr("Stop"))
-        self.pause_btn.setText(self.tr("Pause"))
+        for attr, text in self._LABELS:
+            getattr(self, attr).setText(self.tr(text))
 
     def changeEvent(self, event) -> None:
         if event.type() == QEvent.Type.LanguageChange:
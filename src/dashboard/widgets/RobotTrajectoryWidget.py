@@ -2,10 +2,10 @@ import os
 import time
 import threading
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
-import cv2
 import numpy as np
-from PyQt6.QtCore import QTimer, Qt
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QFont, QImage, QPixmap
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout, QFrame, QSizePolicy
 
@@ -18,19 +18,42 @@ except ImportError:
         LOGO = ""
         CAMERA_PREVIEW_PLACEHOLDER = ""
 
+# OpenCV is slow to import, so it is loaded on first use through _cv2().
+_cv2_module = None
+
+
+def _cv2():
+    global _cv2_module
+    if _cv2_module is None:
+        import cv2
+        _cv2_module = cv2
+    return _cv2_module
+
 
 try:
-    from src.dashboard.resources.styles import BORDER, BG_COLOR, METRIC_BLUE, METRIC_GREEN, TEXT_VALUE, IMAGE_LABEL_STYLE, CONTAINER_FRAME_STYLE
+    from src.dashboard.resources.styles import BORDER, BG_COLOR, METRIC_BLUE, METRIC_GREEN, TEXT_VALUE, IMAGE_LABEL_NAME, CONTAINER_FRAME_NAME
 except ImportError:
     try:
-        from dashboard.styles import BORDER, BG_COLOR, METRIC_BLUE, METRIC_GREEN, TEXT_VALUE, IMAGE_LABEL_STYLE, CONTAINER_FRAME_STYLE
+        from dashboard.styles import BORDER, BG_COLOR, METRIC_BLUE, METRIC_GREEN, TEXT_VALUE, IMAGE_LABEL_NAME, CONTAINER_FRAME_NAME
     except ImportError:
         BORDER = "#E4E6F0"
         BG_COLOR = "#F6F7FB"
         METRIC_BLUE = "#1976D2"
         METRIC_GREEN = "#388E3C"
         TEXT_VALUE = "#212121"
-        IMAGE_LABEL_STYLE = CONTAINER_FRAME_STYLE = ""
+        IMAGE_LABEL_NAME = "trajectoryImage"
+        CONTAINER_FRAME_NAME = "trajectoryContainer"
+
+
+_render_executor: ThreadPoolExecutor | None = None
+
+
+def _get_render_executor() -> ThreadPoolExecutor:
+    """Return the shared single-thread executor that resizes and composites trajectory frames."""
+    global _render_executor
+    if _render_executor is None:
+        _render_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="trajectory-render")
+    return _render_executor
 
 
 class CompactTimeMetric(QWidget):
@@ -65,7 +88,24 @@ class CompactTimeMetric(QWidget):
 class TrajectoryManager:
     def __init__(self, trail_length: int = 100):
         self.trail_length = trail_length
-        self.trajectory_points = deque(maxlen=trail_length)
+        # Producers append to _pending; the reader swaps it out in O(1) under
+        # the lock and writes it into the ring buffer below, which only it touches.
+        self._pending = deque(maxlen=trail_length)
+        self._clear_pending = False
+
+        # Trail as a structure-of-arrays ring: slot head is written next and
+        # the last count slots before it hold the trail, oldest first.
+        self.pts = np.empty((trail_length, 2), dtype=np.int32)
+        self.breaks = np.zeros(trail_length, dtype=np.bool_)
+        self.head = 0
+        self.count = 0
+        self.drained = 0  # points written into the ring so far, including overwritten ones
+        # Smoothed copy of pts, filled as points arrive so a snapshot never
+        # re-smooths the whole trail; _smooth_tail holds the raw points of the
+        # current segment that the next point's trailing mean still needs.
+        self.smoothed = np.empty((trail_length, 2), dtype=np.int32)
+        self._smooth_tail = np.empty((0, 2), dtype=np.int32)
+
         self.current_position = None
         self.last_position = None
         self._lock = threading.Lock()
@@ -78,7 +118,6 @@ class TrajectoryManager:
         self.trail_color = (156, 39, 176)     # Purple 500
         self.current_point_color = (0, 0, 128)  # Navy Blue
 
-        self.start_time = time.time() * 1000
         self.update_count = 0
         self.is_running = True
 
@@ -87,18 +126,19 @@ class TrajectoryManager:
     def add_interpolated_points(self, start_pos, end_pos, num_interpolated=3):
         start_x, start_y = start_pos
         end_x, end_y = end_pos
-        current_time = time.time()
 
-        distance = np.sqrt((end_x - start_x) ** 2 + (end_y - start_y) ** 2)
+        dx = end_x - start_x
+        dy = end_y - start_y
+        rows = []
+        if dx * dx + dy * dy > 25:
+            ts = np.arange(1, num_interpolated + 1) / (num_interpolated + 1)
+            xs = (start_x + ts * dx).astype(np.int32).tolist()
+            ys = (start_y + ts * dy).astype(np.int32).tolist()
+            rows = [(x, y, False) for x, y in zip(xs, ys)]
+        rows.append((end_x, end_y, False))
 
         with self._lock:
-            if distance > 5:
-                for i in range(1, num_interpolated + 1):
-                    t = i / (num_interpolated + 1)
-                    interp_x = int(start_x + t * (end_x - start_x))
-                    interp_y = int(start_y + t * (end_y - start_y))
-                    self.trajectory_points.append((interp_x, interp_y, current_time, False))
-            self.trajectory_points.append((end_x, end_y, current_time, False))
+            self._pending.extend(rows)
 
     def update_position(self, position):
         if self.trajectory_break_pending:
@@ -114,20 +154,96 @@ class TrajectoryManager:
         else:
             with self._lock:
                 is_break_start = self.last_position is None
-                self.trajectory_points.append((*position, time.time(), is_break_start))
+                self._pending.append((*position, is_break_start))
 
     def break_trajectory(self):
         self.trajectory_break_pending = True
 
     def clear_trail(self):
         with self._lock:
-            self.trajectory_points.clear()
+            self._pending = deque(maxlen=self.trail_length)
+            self._clear_pending = True  # applied by the reader on its next snapshot
             self.current_position = None
             self.last_position = None
 
+    def snapshot(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return copies of the trail's ``(points, breaks, smoothed)`` arrays, oldest first.
+
+        *points* is N×2 int32, *breaks* flags the points that start a new
+        segment and *smoothed* is ``_smooth_points`` applied to each segment.
+        Call from a single reader thread.
+        """
+        self._drain_pending()
+        points, breaks, smoothed = self._ordered(self.pts), self._ordered(self.breaks), self._ordered(self.smoothed)
+        # The oldest points may have been smoothed with points that have since
+        # dropped off the trail; recompute them from what is still visible.
+        head = 1 if len(points) > 1 and breaks[1] else 2
+        smoothed[:head] = _smooth_points(points[:head])
+        return points, breaks, smoothed
+
     def get_trajectory_copy(self):
+        """Return the trail as a list of ``(x, y, seq, is_break)`` tuples, oldest first.
+
+        *seq* numbers the points in arrival order.
+        """
+        self._drain_pending()
+        first_seq = self.drained - self.count
+        return list(zip(*(self._ordered(self.pts).T.tolist()),
+                        range(first_seq, self.drained),
+                        self._ordered(self.breaks).tolist()))
+
+    def _drain_pending(self) -> None:
         with self._lock:
-            return list(self.trajectory_points)
+            batch, self._pending = self._pending, deque(maxlen=self.trail_length)
+            clear, self._clear_pending = self._clear_pending, False
+        if clear:
+            self.head = self.count = 0
+            self._smooth_tail = self._smooth_tail[:0]
+        if not batch:
+            return
+        rows = np.array(batch, dtype=np.int32)
+        points = rows[:, :2]
+        breaks = rows[:, 2] != 0
+        slots = (self.head + np.arange(len(rows))) % self.trail_length
+        self.pts[slots] = points
+        self.breaks[slots] = breaks
+        self.smoothed[slots] = self._smooth_batch(points, breaks)
+        self.head = (self.head + len(rows)) % self.trail_length
+        self.count = min(self.trail_length, self.count + len(rows))
+        self.drained += len(rows)
+
+    def _smooth_batch(self, points: np.ndarray, breaks: np.ndarray) -> np.ndarray:
+        """Smooth newly arrived *points*, continuing the current segment unless a break starts a new one."""
+        smoothed = np.empty_like(points)
+        bounds = sorted({0, len(points), *np.flatnonzero(breaks).tolist()})
+        for start, end in zip(bounds, bounds[1:]):
+            history = points[start:end]
+            if not breaks[start]:
+                history = np.concatenate((self._smooth_tail, history))
+            smoothed[start:end] = _smooth_points(history)[len(history) - (end - start):]
+            # the three-sample trailing mean looks back two points
+            self._smooth_tail = history[-2:]
+        return smoothed
+
+    def _ordered(self, ring: np.ndarray) -> np.ndarray:
+        """Copy the trail's slots out of *ring* in oldest-first order."""
+        if self.count < self.trail_length:
+            return ring[self.head - self.count:self.head].copy()
+        return np.concatenate((ring[self.head:], ring[:self.head]))
+
+
+# (icon, float BGR planes, float alpha mask, float scratch) for the last
+# RGBA icon blended, so its float conversion runs once per icon, not per draw.
+_icon_blend_planes: tuple | None = None
+
+
+def _get_icon_blend_planes(icon):
+    global _icon_blend_planes
+    if _icon_blend_planes is None or _icon_blend_planes[0] is not icon:
+        bgr = icon[:, :, :3].astype(np.float32)
+        alpha = icon[:, :, 3:4].astype(np.float32) / 255.0
+        _icon_blend_planes = (icon, bgr, alpha, np.empty_like(bgr))
+    return _icon_blend_planes[1:]
 
 
 def draw_icon_at_position(icon, image, position):
@@ -147,103 +263,290 @@ def draw_icon_at_position(icon, image, position):
 
     if x1 >= 0 and y1 >= 0 and x2 <= image_width and y2 <= image_height:
         if len(icon.shape) == 3 and icon.shape[2] == 4:
-            alpha_logo = icon[:, :, 3] / 255.0
-            alpha_bg = 1.0 - alpha_logo
-            for c in range(0, 3):
-                image[y1:y2, x1:x2, c] = (
-                    alpha_logo * icon[:, :, c] +
-                    alpha_bg * image[y1:y2, x1:x2, c]
-                ).astype(np.uint8)
+            # roi + alpha * (icon - roi), over all three channels at once
+            bgr, alpha, scratch = _get_icon_blend_planes(icon)
+            roi = image[y1:y2, x1:x2]
+            np.subtract(bgr, roi, out=scratch)
+            np.multiply(scratch, alpha, out=scratch)
+            np.add(scratch, roi, out=scratch)
+            roi[...] = scratch
         else:
             image[y1:y2, x1:x2] = icon
 
 
-def draw_smooth_trail(image, trajectory_points_with_breaks):
-    if len(trajectory_points_with_breaks) < 2:
-        return
+def _smooth_points(points: np.ndarray, kernel_size: int = 3) -> np.ndarray:
+    """Trailing moving average of *points* (N×2) over up to *kernel_size* samples, as int32.
 
-    image_width = image.shape[1]
-    image_height = image.shape[0]
+    Window sums come from one cumulative sum, so the cost is a handful of
+    vector operations regardless of N.
+    """
+    n = len(points)
+    cumulative = np.zeros((n + 1, 2), dtype=np.float64)
+    np.cumsum(points, axis=0, out=cumulative[1:])
+    ends = np.arange(1, n + 1)
+    starts = np.maximum(0, ends - kernel_size)
+    sums = cumulative[ends] - cumulative[starts]
+    return (sums / (ends - starts)[:, None]).astype(np.int32)
 
-    segments = []
-    current_segment = []
 
-    for point_data in trajectory_points_with_breaks:
-        if len(point_data) >= 4:
-            x, y, timestamp, is_break = point_data[:4]
-            if is_break and current_segment:
-                if len(current_segment) > 1:
-                    segments.append(current_segment)
-                current_segment = [(x, y)]
-            else:
-                current_segment.append((x, y))
-        else:
-            x, y = point_data[:2]
-            current_segment.append((x, y))
+# The trail gradient is drawn in bands of equal progress, one cv2.polylines
+# call per band. 20 bands keep the 0.3/0.7 colour and 0.25-step thickness
+# breakpoints on band edges, so each band has a single thickness.
+_TRAIL_BANDS = 20
+
+
+def _build_trail_band_luts() -> tuple[tuple, tuple]:
+    """Return the per-band BGR colours and stroke thicknesses, sampled at each band's midpoint."""
+    progress = ((np.arange(_TRAIL_BANDS) + 0.5) / _TRAIL_BANDS)[:, None]
+    head = progress < 0.3
+    middle = progress < 0.7
+    fade = np.select([head, middle], [progress / 0.3, (progress - 0.3) / 0.4], (progress - 0.7) / 0.3)
+    colors = np.select([head, middle],
+                       [fade * (200, 100, 50), (156, 39, 176) + fade * (100, 50, 79)],
+                       fade * (255, 89, 255)).astype(np.int32)
+    # the thickness only steps on band edges, so each band's lower edge gives it
+    band_start = np.arange(_TRAIL_BANDS) / _TRAIL_BANDS
+    thickness = np.maximum(1, (2 + band_start * 4).astype(np.int32))
+    return tuple(map(tuple, colors.tolist())), tuple(thickness.tolist())
+
+
+_TRAIL_BAND_COLORS, _TRAIL_BAND_THICKNESS = _build_trail_band_luts()
+
+
+def _drawable_segments(points: np.ndarray, shape) -> np.ndarray:
+    """Mask of the segments of *points* (segment i joins points i and i + 1) with both ends inside *shape*."""
+    height, width = shape[:2]
+    inside = ((points[:, 0] >= 0) & (points[:, 0] < width) &
+              (points[:, 1] >= 0) & (points[:, 1] < height))
+    return inside[:-1] & inside[1:]
+
+
+def _segment_curves(points: np.ndarray, segments: np.ndarray) -> list[np.ndarray]:
+    """Join the sorted *segments* indices of *points* into polylines, one per consecutive run."""
+    runs = np.split(segments, np.flatnonzero(np.diff(segments) != 1) + 1)
+    return [points[run[0]:run[-1] + 2] for run in runs]
 
-    if len(current_segment) > 1:
-        segments.append(current_segment)
+
+def _draw_gradient_polyline(image, points: np.ndarray) -> None:
+    """Draw *points* (N×2 int32) as a trail fading in colour and thickness along its length.
+
+    Segments with an endpoint outside *image* are skipped; the rest are
+    grouped by progress band and drawn as one polyline call per band.
+    """
+    cv2 = _cv2()
+    total = len(points)
+    drawable = _drawable_segments(points, image.shape)
+    # segment i ends at point i + 1, so its progress is (i + 1) / total
+    bands = (np.arange(1, total) * _TRAIL_BANDS) // total
+
+    for band in np.unique(bands[drawable]).tolist():
+        curves = _segment_curves(points, np.flatnonzero(drawable & (bands == band)))
+        cv2.polylines(image, curves, False, _TRAIL_BAND_COLORS[band], _TRAIL_BAND_THICKNESS[band],
+                      lineType=cv2.LINE_AA)
+
+
+def draw_smooth_trail(image, points, breaks=None, smoothed=None):
+    """Draw the trail through *points* (N×2) onto *image*.
+
+    *breaks* flags the points that start a new segment; segments are
+    smoothed and drawn independently. *smoothed* may carry the already
+    smoothed points, as ``TrajectoryManager.snapshot()`` returns them.
+    """
+    if len(points) < 2:
+        return
+
+    cv2 = _cv2()
+
+    source = points if smoothed is None else smoothed
+    if breaks is None:
+        segments = [source]
+    else:
+        # single points between breaks have nothing to draw
+        segments = [segment for segment in np.split(source, np.flatnonzero(breaks)) if len(segment) > 1]
 
     for segment in segments:
-        if len(segment) < 2:
-            continue
-
-        segment_points = np.array(segment, dtype=np.float32)
-        smoothed_points = []
-        kernel_size = 3
-
-        for i in range(len(segment_points)):
-            start = max(0, i - kernel_size + 1)
-            avg_x = np.mean(segment_points[start:i + 1, 0])
-            avg_y = np.mean(segment_points[start:i + 1, 1])
-            smoothed_points.append((int(avg_x), int(avg_y)))
-
-        total = len(smoothed_points)
-
-        for i in range(total - 1):
-            progress = (i + 1) / total
-            if progress < 0.3:
-                fade_factor = progress / 0.3
-                color = (int(200 * fade_factor), int(100 * fade_factor), int(50 * fade_factor))
-            elif progress < 0.7:
-                fade_factor = (progress - 0.3) / 0.4
-                color = (int(156 + (100 * fade_factor)),
-                         int(39 + (50 * fade_factor)),
-                         int(176 + (79 * fade_factor)))
-            else:
-                fade_factor = (progress - 0.7) / 0.3
-                color = (int(255 * fade_factor), int(89 * fade_factor), int(255 * fade_factor))
+        if smoothed is None:
+            segment = _smooth_points(segment)
+        _draw_gradient_polyline(image, segment)
+
+        # Glow over the newest points: a wide pale stroke under a thin core
+        if len(segment) > 5:
+            recent = segment[-5:]
+            glow = np.flatnonzero(_drawable_segments(recent, image.shape))
+            if len(glow):
+                curves = _segment_curves(recent, glow)
+                cv2.polylines(image, curves, False, (255, 200, 255), 6, lineType=cv2.LINE_AA)
+                cv2.polylines(image, curves, False, (255, 100, 255), 2, lineType=cv2.LINE_AA)
 
-            thickness = max(1, int(2 + (progress * 4)))
-            p1 = smoothed_points[i]
-            p2 = smoothed_points[i + 1]
 
-            if (0 <= p1[0] < image_width and 0 <= p1[1] < image_height and
-                    0 <= p2[0] < image_width and 0 <= p2[1] < image_height):
-                cv2.line(image, p1, p2, color, thickness, lineType=cv2.LINE_AA)
+# Margin around the trail's points that covers the widest stroke (the 6 px
+# glow) plus antialiasing, so restoring this box erases the whole trail.
+_TRAIL_BBOX_PAD = 8
 
-        if len(smoothed_points) > 5:
-            recent_points = smoothed_points[-5:]
-            for i in range(len(recent_points) - 1):
-                p1 = recent_points[i]
-                p2 = recent_points[i + 1]
-                if (0 <= p1[0] < image_width and 0 <= p1[1] < image_height and
-                        0 <= p2[0] < image_width and 0 <= p2[1] < image_height):
-                    cv2.line(image, p1, p2, (255, 200, 255), 6, lineType=cv2.LINE_AA)
-                    cv2.line(image, p1, p2, (255, 100, 255), 2, lineType=cv2.LINE_AA)
+
+def _trail_bbox(points: np.ndarray, shape) -> tuple[int, int, int, int]:
+    """Return the (x0, y0, x1, y1) box, clipped to *shape*, that a trail through *points* can touch."""
+    (x_min, y_min), (x_max, y_max) = points.min(axis=0).tolist(), points.max(axis=0).tolist()
+    height, width = shape[:2]
+    return (max(0, x_min - _TRAIL_BBOX_PAD), max(0, y_min - _TRAIL_BBOX_PAD),
+            min(width, x_max + _TRAIL_BBOX_PAD + 1), min(height, y_max + _TRAIL_BBOX_PAD + 1))
+
+
+# Decoded logo and placeholder images keyed by (path, width, height). The
+# arrays are shared between widgets, so they are marked read-only.
+_image_cache: dict[tuple, np.ndarray | None] = {}
 
 
 def load_logo_icon():
-    if not LOGO or not os.path.exists(LOGO):
-        return None
-    try:
-        from PIL import Image
-        pil_image = Image.open(LOGO).convert('RGBA')
-        logo = np.array(pil_image)
-        logo = cv2.cvtColor(logo, cv2.COLOR_RGBA2BGRA)
-        return cv2.resize(logo, (36, 36), interpolation=cv2.INTER_AREA)
-    except Exception:
-        return None
+    cache_key = (LOGO, 36, 36)
+    if cache_key in _image_cache:
+        return _image_cache[cache_key]
+    logo = None
+    if LOGO and os.path.exists(LOGO):
+        try:
+            from PIL import Image
+            pil_image = Image.open(LOGO).convert('RGBA')
+            logo = np.array(pil_image)
+            cv2 = _cv2()
+            logo = cv2.cvtColor(logo, cv2.COLOR_RGBA2BGRA)
+            logo = cv2.resize(logo, (36, 36), interpolation=cv2.INTER_AREA)
+            logo.flags.writeable = False
+        except Exception:
+            logo = None
+    _image_cache[cache_key] = logo
+    return logo
+
+
+def _load_placeholder_image(width: int, height: int) -> np.ndarray:
+    """Return the camera placeholder at *width*×*height*, black if there is none."""
+    cache_key = (CAMERA_PREVIEW_PLACEHOLDER, width, height)
+    placeholder_image = _image_cache.get(cache_key)
+    if placeholder_image is None:
+        if not CAMERA_PREVIEW_PLACEHOLDER or not os.path.exists(CAMERA_PREVIEW_PLACEHOLDER):
+            placeholder_image = np.zeros((height, width, 3), dtype=np.uint8)
+        else:
+            cv2 = _cv2()
+            placeholder_image = cv2.imread(CAMERA_PREVIEW_PLACEHOLDER)
+            placeholder_image = cv2.resize(placeholder_image, (width, height))
+        placeholder_image.flags.writeable = False
+        _image_cache[cache_key] = placeholder_image
+    return placeholder_image
+
+
+class FrameRenderer(QObject):
+    """Resizes background frames and composites the trail onto them off the GUI thread.
+
+    The GUI thread hands over a background with ``set_background()`` and a
+    ``TrajectoryManager.snapshot()`` trail with ``submit()``. Only the latest of each is kept, so
+    everything that arrives while a render is running is coalesced into the
+    next one. Finished frames come back through ``rendered`` as QImages that
+    own their pixels.
+    """
+
+    rendered = pyqtSignal(QImage)
+    # (generation, resized background or None when the frame could not be resized)
+    background_changed = pyqtSignal(int, object)
+
+    def __init__(self, width: int, height: int, parent=None):
+        super().__init__(parent)
+        self.width = width
+        self.height = height
+        self._lock = threading.Lock()
+        self._pending_background: tuple | None = None  # (generation, frame)
+        self._generation = 0
+        self._pending_trail: tuple | None = None
+        self._queued = False
+        # Touched only by the thread running render(): the background, the
+        # composited canvas with a QImage over its buffer, and the box the
+        # last trail was drawn in.
+        self._base = None
+        self._base_changed = False
+        self._canvas = None
+        self._canvas_image: QImage | None = None
+        self._trail_bbox: tuple | None = None
+
+    def set_background(self, frame) -> int:
+        """Use *frame* as the background from the next render on (latest wins).
+
+        Returns the generation that ``background_changed`` reports for this
+        frame, so results of superseded frames can be told apart.
+        """
+        with self._lock:
+            self._generation += 1
+            self._pending_background = (self._generation, frame)
+            return self._generation
+
+    def submit(self, trail: tuple | None) -> None:
+        """Queue a render of *trail* on the render executor, merging with one already queued."""
+        with self._lock:
+            self._pending_trail = trail
+            if self._queued:
+                return
+            self._queued = True
+        _get_render_executor().submit(self._render_pending)
+
+    def render(self, trail: tuple | None) -> QImage | None:
+        """Composite the ``(points, breaks[, smoothed])`` *trail* onto the latest background and return the result.
+
+        Calls must not overlap; the widget only calls this from the render
+        executor, apart from one call at construction before anything is queued.
+        """
+        with self._lock:
+            pending, self._pending_background = self._pending_background, None
+        if pending is not None:
+            self._adopt_background(*pending)
+        if self._base is None:
+            return None
+
+        if self._canvas is None:
+            self._canvas = self._base.copy()
+            h, w, ch = self._canvas.shape
+            self._canvas_image = QImage(self._canvas.data, w, h, ch * w, QImage.Format.Format_BGR888)
+        elif self._base_changed:
+            np.copyto(self._canvas, self._base)
+        elif self._trail_bbox is not None:
+            x0, y0, x1, y1 = self._trail_bbox
+            self._canvas[y0:y1, x0:x1] = self._base[y0:y1, x0:x1]
+        self._base_changed = False
+        self._trail_bbox = None
+
+        if trail is not None and len(trail[0]):
+            self._trail_bbox = _trail_bbox(trail[0], self._canvas.shape)
+            try:
+                draw_smooth_trail(self._canvas, *trail)
+            except (IndexError, ValueError):
+                pass
+
+        # copy() detaches the image from the canvas, which the next render reuses
+        return self._canvas_image.copy()
+
+    def _adopt_background(self, generation: int, frame) -> None:
+        try:
+            if frame.shape[:2] == (self.height, self.width):
+                resized = frame.copy()  # already the right size, e.g. the placeholder
+            else:
+                resized = _cv2().resize(frame, (self.width, self.height))
+        except Exception:
+            resized = None
+        if resized is not None:
+            self._base = resized
+            self._base_changed = True
+        try:
+            self.background_changed.emit(generation, resized)
+        except RuntimeError:
+            pass  # widget was deleted while the frame was being resized
+
+    def _render_pending(self) -> None:
+        with self._lock:
+            trail, self._pending_trail = self._pending_trail, None
+            self._queued = False
+        image = self.render(trail)
+        if image is None:
+            return
+        try:
+            self.rendered.emit(image)
+        except RuntimeError:
+            pass  # widget was deleted while the frame was being rendered
 
 
 class RobotTrajectoryWidget(QWidget):
@@ -256,6 +559,9 @@ class RobotTrajectoryWidget(QWidget):
     enable_drawing(), disable_drawing() from the adapter.
     """
 
+    # Queued to the GUI thread when a producer on another thread marks the view dirty
+    _redraw_requested = pyqtSignal()
+
     def __init__(self, image_width=640, image_height=360,
                  fps_ms: int = 30, trail_length: int = 100):
         super().__init__()
@@ -263,22 +569,36 @@ class RobotTrajectoryWidget(QWidget):
         self.image_width = image_width
         self.image_height = image_height
 
-        self.estimated_time_value = 0.0
-        self.time_left_value = 0.0
+        self._estimated_time_value = 0.0
+        self._time_left_value = 0.0
 
-        self.base_frame = None
-        self.current_frame = None
+        self.base_frame = None  # background currently shown, as resized by the renderer
+        self._background_request = 0  # generation of the latest background handed to the renderer
+        self._dirty = True      # trail or background changed since the last render request
         self.trajectory_manager = TrajectoryManager(trail_length=trail_length)
 
+        # Redraws are event driven: new data arms a single-shot timer that
+        # fires no sooner than _min_interval_ms after the previous draw.
+        self._min_interval_ms = float(fps_ms)
+        self._last_draw_ms = 0.0
+        self._redraw_scheduled = False
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.update_display)
+        self._redraw_requested.connect(self._start_redraw_timer)
+
+        self._renderer = FrameRenderer(image_width, image_height, parent=self)
+        self._renderer.rendered.connect(self._show_rendered)
+        self._renderer.background_changed.connect(self._on_background_changed)
+
         self.init_ui()
 
         self.logo_icon = load_logo_icon()
-        self.load_placeholder_image()
         self.drawing_enabled = False
-
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_display)
-        self.timer.start(fps_ms)
+        self.load_placeholder_image()
+        # Nothing is queued on the render executor yet, so the first frame can
+        # be rendered here and the label is never shown empty.
+        self._show_rendered(self._renderer.render(None))
 
     def init_ui(self):
         self.setWindowTitle("Trajectory Tracker")
@@ -297,7 +617,7 @@ class RobotTrajectoryWidget(QWidget):
 
         self.image_label = QLabel()
         self.image_label.setFixedSize(self.image_width, self.image_height)
-        self.image_label.setStyleSheet(IMAGE_LABEL_STYLE)
+        self.image_label.setObjectName(IMAGE_LABEL_NAME)
         self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.image_label.setScaledContents(False)
         self.image_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
@@ -310,7 +630,7 @@ class RobotTrajectoryWidget(QWidget):
 
         container_frame = QFrame()
         container_frame.setLayout(container_layout)
-        container_frame.setStyleSheet(CONTAINER_FRAME_STYLE)
+        container_frame.setObjectName(CONTAINER_FRAME_NAME)
 
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -321,14 +641,9 @@ class RobotTrajectoryWidget(QWidget):
 
     def load_placeholder_image(self):
         try:
-            if not CAMERA_PREVIEW_PLACEHOLDER or not os.path.exists(CAMERA_PREVIEW_PLACEHOLDER):
-                placeholder_image = np.zeros((self.image_height, self.image_width, 3), dtype=np.uint8)
-            else:
-                placeholder_image = cv2.imread(CAMERA_PREVIEW_PLACEHOLDER)
-                placeholder_image = cv2.resize(placeholder_image, (self.image_width, self.image_height))
-            self.base_frame = placeholder_image.copy()
-            self.current_frame = placeholder_image.copy()
-            self._update_label_from_frame()
+            placeholder_image = _load_placeholder_image(self.image_width, self.image_height)
+            self._background_request = self._renderer.set_background(placeholder_image)
+            self._request_redraw()
         except Exception as e:
             raise ValueError(f"Error loading placeholder image: {e}")
 
@@ -336,67 +651,133 @@ class RobotTrajectoryWidget(QWidget):
     #  Public setter API                                                   #
     # ------------------------------------------------------------------ #
 
+    # The setters that take values are plain methods rather than typed
+    # @pyqtSlots, so the adapter can connect signals of any payload type.
+
     def update_trajectory_point(self, message=None) -> None:
         """Receive a trajectory point message and update the manager."""
         if message is None:
             return
         x, y = message.get("x", 0), message.get("y", 0)
         self.trajectory_manager.update_position((int(x), int(y)))
+        self._request_trail_redraw()
 
+    def update_trajectory_points(self, messages) -> None:
+        """Apply a batch of trajectory point messages in arrival order."""
+        update_position = self.trajectory_manager.update_position
+        for message in messages:
+            if message is not None:
+                update_position((int(message.get("x", 0)), int(message.get("y", 0))))
+        self._request_trail_redraw()
+
+    @pyqtSlot()
     def break_trajectory(self) -> None:
         self.trajectory_manager.break_trajectory()
+        self._request_trail_redraw()
 
     def set_image(self, message=None) -> None:
+        """Show a new background frame; it is resized on the render thread."""
         if message is None or not isinstance(message, dict) or "image" not in message:
             return
         frame = message.get("image")
         if frame is None:
             self.load_placeholder_image()
             return
-        try:
-            frame = cv2.resize(frame, (self.image_width, self.image_height))
-            self.base_frame = frame.copy()
-            self.trajectory_manager.clear_trail()
-        except Exception:
+        self.trajectory_manager.clear_trail()
+        self._background_request = self._renderer.set_background(frame)
+        self._request_redraw()
+
+    @pyqtSlot(int, object)
+    def _on_background_changed(self, generation: int, frame) -> None:
+        if generation != self._background_request:
+            return  # a newer background was set while this one was being resized
+        if frame is None:
             self.load_placeholder_image()
+            return
+        self.base_frame = frame
+
+    @property
+    def estimated_time_value(self) -> float:
+        return self._estimated_time_value
+
+    @estimated_time_value.setter
+    def estimated_time_value(self, seconds: float) -> None:
+        # The metric labels are refreshed by update_display, so schedule one;
+        # the frame itself is only re-rendered if something else made it dirty.
+        self._estimated_time_value = seconds
+        self._request_display_update()
+
+    @property
+    def time_left_value(self) -> float:
+        return self._time_left_value
+
+    @time_left_value.setter
+    def time_left_value(self, seconds: float) -> None:
+        self._time_left_value = seconds
+        self._request_display_update()
 
+    @pyqtSlot()
     def enable_drawing(self, _=None) -> None:
         self.drawing_enabled = True
+        self._request_redraw()
 
+    @pyqtSlot()
     def disable_drawing(self, _=None) -> None:
         self.drawing_enabled = False
         self.trajectory_manager.clear_trail()
+        self._request_redraw()
 
     # ------------------------------------------------------------------ #
     #  Internal display update                                             #
     # ------------------------------------------------------------------ #
 
-    def update_display(self):
-        if self.base_frame is None:
+    def set_max_redraw_rate(self, hz: float) -> None:
+        """Cap redraws at *hz* per second; data arriving faster is coalesced into one draw."""
+        if hz <= 0:
+            raise ValueError(f"Redraw rate must be positive, got {hz}")
+        self._min_interval_ms = 1000.0 / hz
+
+    def _request_redraw(self) -> None:
+        """Mark the view dirty and make sure a redraw is scheduled (callable from any thread)."""
+        self._dirty = True
+        self._request_display_update()
+
+    def _request_display_update(self) -> None:
+        """Schedule update_display, which refreshes the metrics and redraws if dirty (any thread)."""
+        if not self._redraw_scheduled:
+            self._redraw_scheduled = True
+            self._redraw_requested.emit()
+
+    def _request_trail_redraw(self) -> None:
+        """Request a redraw for a trail change; hidden trails leave the view unchanged."""
+        if self.drawing_enabled:
+            self._request_redraw()
+
+    @pyqtSlot()
+    def _start_redraw_timer(self) -> None:
+        if self.timer.isActive():
             return
+        elapsed = time.monotonic() * 1000 - self._last_draw_ms
+        self.timer.start(max(0, int(self._min_interval_ms - elapsed)))
 
-        self.current_frame = self.base_frame.copy()
-        trajectory_points_copy = self.trajectory_manager.get_trajectory_copy()
-
-        if self.drawing_enabled and trajectory_points_copy:
-            try:
-                draw_smooth_trail(image=self.current_frame,
-                                  trajectory_points_with_breaks=trajectory_points_copy)
-            except (IndexError, ValueError):
-                pass
-
-        self._update_label_from_frame()
-        self.trajectory_manager.update_count += 1
+    @pyqtSlot()
+    def update_display(self):
+        self._redraw_scheduled = False
+        self._last_draw_ms = time.monotonic() * 1000
         self.estimated_metric.update_value(f"{self.estimated_time_value:.2f} s")
         self.time_left_metric.update_value(f"{self.time_left_value:.2f} s")
-
-    def _update_label_from_frame(self):
-        if self.current_frame is None:
+        if not self._dirty:
             return
-        rgb_image = cv2.cvtColor(self.current_frame, cv2.COLOR_BGR2RGB)
-        h, w, ch = rgb_image.shape
-        q_image = QImage(rgb_image.data, w, h, ch * w, QImage.Format.Format_RGB888)
-        self.image_label.setPixmap(QPixmap.fromImage(q_image))
+        self._dirty = False
+
+        trail = self.trajectory_manager.snapshot() if self.drawing_enabled else None
+        self._renderer.submit(trail)
+        self.trajectory_manager.update_count += 1
+
+    @pyqtSlot(QImage)
+    def _show_rendered(self, image) -> None:
+        if image is not None:
+            self.image_label.setPixmap(QPixmap.fromImage(image))
 
     def get_image_dimensions(self):
         return self.image_width, self.image_height
@@ -9,21 +9,22 @@ Provides base classes for creating wizards with:
 - Customizable styling
 """
 
-from pathlib import Path
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Callable, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from PyQt6.QtWidgets import (
     QWizard, QWizardPage, QVBoxLayout, QLabel,
-    QRadioButton, QButtonGroup, QTextEdit
+    QRadioButton, QButtonGroup
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPixmap, QFont, QIcon
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QPixmap, QFont, QIcon, QImage, QImageReader, QPalette, QColor
 
 try:
-    from src.utils_widgets.MaterialButton import MaterialButton
+    from src.utils.utils_widgets.MaterialButton import MaterialButton
 except ImportError:
-    from dashboard.ui.widgets.shared.MaterialButton import MaterialButton
+    from utils.utils_widgets.MaterialButton import MaterialButton
 
 try:
     from src.dashboard.resources.styles import WIZARD_IMAGE_PLACEHOLDER_STYLE, WIZARD_WARNING_LABEL_STYLE, STATUS_ERROR
@@ -31,12 +32,161 @@ except ImportError:
     try:
         from dashboard.styles import WIZARD_IMAGE_PLACEHOLDER_STYLE, WIZARD_WARNING_LABEL_STYLE, STATUS_ERROR
     except ImportError:
-        WIZARD_IMAGE_PLACEHOLDER_STYLE = "QLabel { background-color: #F6F7FB; border: 2px dashed #E4E6F0; border-radius: 8px; }"
+        WIZARD_IMAGE_PLACEHOLDER_STYLE = "background-color: #F6F7FB; border: 2px dashed #E4E6F0; border-radius: 8px;"
         WIZARD_WARNING_LABEL_STYLE = "font-size: 12px; padding: 10px; background-color: #fff3cd; border-radius: 5px;"
         STATUS_ERROR = "#d9534f"
 
+_IMAGE_LABEL_NAME = "wizardStepImage"
+_DESCRIPTION_LABEL_NAME = "wizardStepDescription"
+_SELECTION_LABEL_NAME = "wizardSelectionLabel"
+_ERROR_LABEL_NAME = "wizardSelectionError"
+_WARNING_LABEL_NAME = "wizardSelectionWarning"
+_SUMMARY_TEXT_NAME = "wizardSummaryText"
+
+# Every step widget is styled through this one sheet, scoped by object name
+# and set on the ConfigurableWizard, so it is parsed once per wizard instead
+# of once per widget.
+_WIZARD_STYLESHEET = f"""
+QLabel#{_IMAGE_LABEL_NAME} {{ {WIZARD_IMAGE_PLACEHOLDER_STYLE} }}
+QLabel#{_DESCRIPTION_LABEL_NAME} {{ margin: 15px 0; line-height: 1.5; font-size: 16px; }}
+QLabel#{_SELECTION_LABEL_NAME} {{ font-weight: bold; margin-top: 10px; font-size: 16px; }}
+QLabel#{_WARNING_LABEL_NAME} {{ {WIZARD_WARNING_LABEL_STYLE} }}
+QLabel#{_SUMMARY_TEXT_NAME} {{ font-size: 14px; }}
+"""
+
+# Font for the "no image" placeholder text; created on first use because a
+# QFont needs a QApplication.
+_placeholder_font: Optional[QFont] = None
+
+
+def _get_placeholder_font() -> QFont:
+    global _placeholder_font
+    if _placeholder_font is None:
+        _placeholder_font = QFont()
+        _placeholder_font.setPointSize(14)
+    return _placeholder_font
+
+
+# Font shared by every SelectionStep radio button; QFont is implicitly
+# shared, so all radios reference one font instead of matching a QSS rule.
+_radio_font: Optional[QFont] = None
+
+
+def _get_radio_font() -> QFont:
+    global _radio_font
+    if _radio_font is None:
+        _radio_font = QFont()
+        _radio_font.setPixelSize(14)
+    return _radio_font
+
+
+# Text colour and font for the empty-options error label, applied directly
+# rather than through a stylesheet rule; created on first use.
+_error_palette: Optional[QPalette] = None
+_error_font: Optional[QFont] = None
+
+
+def _style_error_label(label: QLabel):
+    global _error_palette, _error_font
+    if _error_palette is None:
+        _error_palette = QPalette()
+        _error_palette.setColor(QPalette.ColorRole.WindowText, QColor(STATUS_ERROR))
+        _error_font = QFont()
+        _error_font.setBold(True)
+        _error_font.setPixelSize(14)
+    label.setPalette(_error_palette)
+    label.setFont(_error_font)
+    label.setContentsMargins(10, 10, 10, 10)
+
+
+# Scaled pixmaps keyed by (path, width, height), least recently used first;
+# QPixmap is implicitly shared, so every page showing the same image reuses
+# one decoded copy. Only the most recent _PIXMAP_CACHE_SIZE are kept.
+_PIXMAP_CACHE_SIZE = 32
+_pixmap_cache: OrderedDict[tuple, QPixmap] = OrderedDict()
+
+_LOGO_SIZE = (60, 60)
+
+_image_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_image_executor() -> ThreadPoolExecutor:
+    """Return the shared single-thread executor that decodes wizard images off the GUI thread."""
+    global _image_executor
+    if _image_executor is None:
+        _image_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wizard-images")
+    return _image_executor
+
 
-@dataclass
+def _read_scaled_image(path: str, width: int, height: int) -> QImage:
+    """Decode *path* scaled to fit *width*×*height*; safe to call from any thread, unlike QPixmap."""
+    reader = QImageReader(path)
+    source_size = reader.size()
+    if not source_size.isValid():
+        # No size in the header; decode in full and scale afterwards
+        image = reader.read()
+        if image.isNull():
+            return image
+        return image.scaled(
+            width, height,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+
+    # Decode straight to the final size: formats like JPEG downscale while
+    # decoding, the rest are smooth-scaled once by the reader.
+    reader.setScaledSize(source_size.scaled(width, height, Qt.AspectRatioMode.KeepAspectRatio))
+    return reader.read()
+
+
+def _cached_pixmap(path: str, width: int, height: int) -> Optional[QPixmap]:
+    """Return the cached pixmap for *path* at this size, or None, marking it recently used."""
+    key = (path, width, height)
+    pixmap = _pixmap_cache.get(key)
+    if pixmap is not None:
+        _pixmap_cache.move_to_end(key)
+    return pixmap
+
+
+def _cache_scaled_pixmap(path: str, width: int, height: int, image: QImage) -> QPixmap:
+    """Convert the decoded *image* to a pixmap and remember it for *path* at this size."""
+    pixmap = _cached_pixmap(path, width, height)
+    if pixmap is None:
+        pixmap = _pixmap_cache[(path, width, height)] = QPixmap.fromImage(image)
+        if len(_pixmap_cache) > _PIXMAP_CACHE_SIZE:
+            _pixmap_cache.popitem(last=False)
+    return pixmap
+
+
+def _load_scaled_pixmap(path: str, width: int, height: int) -> QPixmap:
+    """Load *path* scaled to fit *width*×*height*; a null pixmap if it cannot be read."""
+    cached = _cached_pixmap(path, width, height)
+    if cached is not None:
+        return cached
+
+    image = _read_scaled_image(path, width, height)
+    if image.isNull():
+        return QPixmap()
+    return _cache_scaled_pixmap(path, width, height, image)
+
+
+# Window icons keyed by path; only icons that loaded are cached.
+_icon_cache: dict[str, QIcon] = {}
+
+
+def _load_icon(path: str) -> Optional[QIcon]:
+    """Load the icon at *path*, or None if it cannot be read."""
+    icon = _icon_cache.get(path)
+    if icon is None:
+        # QIcon reports a missing or unreadable file as null, so no separate stat is needed
+        icon = QIcon(path)
+        if icon.isNull():
+            return None
+        _icon_cache[path] = icon
+    return icon
+
+
+@dataclass(frozen=True, slots=True)
 class WizardStepConfig:
     """Configuration for a wizard step."""
     title: str
@@ -44,64 +194,100 @@ class WizardStepConfig:
     description: str
     image_path: Optional[str] = None
     step_number: Optional[int] = None  # For "Step N:" prefix
+    full_title: str = field(init=False, repr=False, compare=False)  # title with the "Step N:" prefix applied
+
+    def __post_init__(self):
+        if self.step_number is not None:
+            object.__setattr__(self, "full_title", f"Step {self.step_number}: {self.title}")
+        else:
+            object.__setattr__(self, "full_title", self.title)
+
+
+class _ContentSection:
+    """The content part of a step's layout, between the description and the trailing stretch.
+
+    Stands in for a nested ``QVBoxLayout``: widgets added here are inserted
+    straight into the page layout, just above the stretch.
+    """
+
+    def __init__(self, layout: QVBoxLayout):
+        self._layout = layout
+
+    def addWidget(self, widget, stretch: int = 0, alignment=Qt.AlignmentFlag(0)):
+        self._layout.insertWidget(self._layout.count() - 1, widget, stretch, alignment)
+
+    def addLayout(self, layout, stretch: int = 0):
+        self._layout.insertLayout(self._layout.count() - 1, layout, stretch)
+
+    def addSpacing(self, size: int):
+        self._layout.insertSpacing(self._layout.count() - 1, size)
 
 
 class GenericWizardStep(QWizardPage):
-    """Generic wizard step with title, subtitle, description, and optional image."""
+    """Generic wizard step with title, subtitle, description, and optional image.
+
+    The page layout and ``content_layout`` exist from construction, so
+    subclasses can add widgets and register fields in ``__init__``. The image
+    and description are built the first time the wizard shows the page (see
+    ``initializePage``), together with anything added in ``_build_content``.
+    """
 
     def __init__(self, config: WizardStepConfig):
         super().__init__()
         self.config = config
+        self._built = False
 
-        # Set title with optional step number
-        if config.step_number is not None:
-            self.setTitle(f"Step {config.step_number}: {config.title}")
-        else:
-            self.setTitle(config.title)
+        self.setTitle(config.full_title)
 
         self.setSubTitle(config.subtitle)
+
+        # One flat layout: header widgets go above the content, the stretch stays last
+        layout = QVBoxLayout()
+        layout.addStretch()
+        self.setLayout(layout)
+
+        # Content section for subclasses to add custom widgets
+        self.content_layout = _ContentSection(layout)
+
+    def initializePage(self):
+        """Called when the page is shown - build its widgets on first use."""
+        self._ensure_built()
+        super().initializePage()
+
+    def _ensure_built(self):
+        if self._built:
+            return
+        self._built = True
         self._build_ui()
+        self._build_content()
+
+    def _build_content(self):
+        """Add step-specific widgets to ``content_layout``; runs once, after ``_build_ui``."""
 
     def _build_ui(self):
-        layout = QVBoxLayout()
+        layout = self.layout()
 
         # Image section
         self.image_label = QLabel()
         self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.image_label.setMinimumHeight(200)
-        self.image_label.setStyleSheet(WIZARD_IMAGE_PLACEHOLDER_STYLE)
+        self.image_label.setObjectName(_IMAGE_LABEL_NAME)
 
         if self.config.image_path:
-            pixmap = QPixmap(self.config.image_path)
-            if not pixmap.isNull():
-                scaled_pixmap = pixmap.scaled(
-                    400, 200,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
+            scaled_pixmap = _load_scaled_pixmap(self.config.image_path, 400, 200)
+            if not scaled_pixmap.isNull():
                 self.image_label.setPixmap(scaled_pixmap)
         else:
             self.image_label.setText("📷 Image Placeholder")
-            font = QFont()
-            font.setPointSize(14)
-            self.image_label.setFont(font)
+            self.image_label.setFont(_get_placeholder_font())
 
-        layout.addWidget(self.image_label)
+        layout.insertWidget(0, self.image_label)
 
         # Description
         description_label = QLabel(self.config.description)
         description_label.setWordWrap(True)
-        description_label.setStyleSheet(
-            "QLabel { margin: 15px 0; line-height: 1.5; font-size: 16px; }"
-        )
-        layout.addWidget(description_label)
-
-        # Content layout for subclasses to add custom widgets
-        self.content_layout = QVBoxLayout()
-        layout.addLayout(self.content_layout)
-
-        layout.addStretch()
-        self.setLayout(layout)
+        description_label.setObjectName(_DESCRIPTION_LABEL_NAME)
+        layout.insertWidget(1, description_label)
 
 
 class SelectionStep(GenericWizardStep):
@@ -119,74 +305,102 @@ class SelectionStep(GenericWizardStep):
         self.selection_label = selection_label
         self.empty_message = empty_message
         self.empty_instructions = empty_instructions
-        self.radio_buttons: List[QRadioButton] = []
         self.button_group: Optional[QButtonGroup] = None
 
         super().__init__(config)
+
+    def _build_content(self):
         self._build_selection_ui()
 
     def _build_selection_ui(self):
         label = QLabel(self.selection_label)
-        label.setStyleSheet("font-weight: bold; margin-top: 10px; font-size: 16px;")
+        label.setObjectName(_SELECTION_LABEL_NAME)
         self.content_layout.addWidget(label)
 
         if not self.options:
             # Show empty state
             error_label = QLabel(f"⚠️ {self.empty_message}")
-            error_label.setStyleSheet(
-                f"color: {STATUS_ERROR}; font-weight: bold; font-size: 14px; padding: 10px;"
-            )
+            error_label.setObjectName(_ERROR_LABEL_NAME)
+            _style_error_label(error_label)
             self.content_layout.addWidget(error_label)
 
             instruction_label = QLabel(self.empty_instructions)
-            instruction_label.setStyleSheet(WIZARD_WARNING_LABEL_STYLE)
+            instruction_label.setObjectName(_WARNING_LABEL_NAME)
             instruction_label.setWordWrap(True)
             self.content_layout.addWidget(instruction_label)
             return
 
         # Create radio buttons
         self.button_group = QButtonGroup(self)
-        for idx, option in enumerate(self.options):
-            radio = QRadioButton(option)
-            radio.setStyleSheet("font-size: 14px;")
-            if idx == 0:
-                radio.setChecked(True)
-            self.button_group.addButton(radio, idx)
-            self.radio_buttons.append(radio)
-            self.content_layout.addWidget(radio)
+        self.setUpdatesEnabled(False)
+        try:
+            for idx, option in enumerate(self.options):
+                radio = QRadioButton(option)
+                radio.setFont(_get_radio_font())
+                if idx == 0:
+                    radio.setChecked(True)
+                self.button_group.addButton(radio, idx)
+                self.content_layout.addWidget(radio)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def get_selected_option(self) -> Optional[str]:
         """Get the currently selected option."""
-        for radio in self.radio_buttons:
-            if radio.isChecked():
-                return radio.text()
-        return self.radio_buttons[0].text() if self.radio_buttons else None
+        if not self._built:
+            return self.options[0] if self.options else None  # the default choice
+        if self.button_group is None:
+            return None
+        checked = self.button_group.checkedButton() or self.button_group.button(0)
+        return checked.text()
 
 
 class SummaryStep(GenericWizardStep):
-    """Generic summary/review step with HTML content."""
+    """Generic summary/review step with HTML content.
+
+    If *tracked_fields* names the wizard fields the summary depends on, the
+    summary is only regenerated when one of them has changed since it was
+    last shown; otherwise it is regenerated every time the page is shown.
+    """
 
     def __init__(
         self,
         config: WizardStepConfig,
-        summary_generator: Optional[Callable[[QWizard], str]] = None
+        summary_generator: Optional[Callable[[QWizard], str]] = None,
+        tracked_fields: Optional[List[str]] = None
     ):
         self.summary_generator = summary_generator
+        self.tracked_fields = tuple(tracked_fields) if tracked_fields is not None else None
+        self._last_field_snapshot: Optional[tuple] = None
         super().__init__(config)
+
+    def _build_content(self):
         self._build_summary_ui()
 
     def _build_summary_ui(self):
-        self.summary_text = QTextEdit()
-        self.summary_text.setReadOnly(True)
-        self.summary_text.setMaximumHeight(150)
-        self.summary_text.setStyleSheet("font-size: 14px;")
+        # A rich-text label renders the summary without a QTextEdit's document and editing machinery
+        self.summary_text = QLabel()
+        self.summary_text.setTextFormat(Qt.TextFormat.RichText)
+        self.summary_text.setWordWrap(True)
+        self.summary_text.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+        self.summary_text.setTextInteractionFlags(Qt.TextInteractionFlag.TextBrowserInteraction)
+        self.summary_text.setObjectName(_SUMMARY_TEXT_NAME)
         self.content_layout.addWidget(self.summary_text)
 
     def initializePage(self):
         """Called when the page is shown - generate summary dynamically."""
-        if self.summary_generator:
-            summary_html = self.summary_generator(self.wizard())
-            self.summary_text.setHtml(summary_html)
+        super().initializePage()
+        if not self.summary_generator:
+            return
+
+        wizard = self.wizard()
+        snapshot = None
+        if self.tracked_fields is not None:
+            snapshot = tuple(wizard.field(name) for name in self.tracked_fields)
+            if snapshot == self._last_field_snapshot:
+                return  # nothing the summary depends on has changed
+
+        self.summary_text.setText(self.summary_generator(wizard))
+        self._last_field_snapshot = snapshot
 
 
 class ConfigurableWizard(QWizard):
@@ -202,8 +416,13 @@ class ConfigurableWizard(QWizard):
             min_width=600,
             min_height=500
         )
+
+    The logo is decoded on a background thread and appears once it is ready.
     """
 
+    # (path, scaled logo) decoded on the image executor
+    _logo_loaded = pyqtSignal(str, QImage)
+
     def __init__(
         self,
         title: str,
@@ -219,25 +438,23 @@ class ConfigurableWizard(QWizard):
         super().__init__(parent)
 
         self.setWindowTitle(title)
+        self.setStyleSheet(_WIZARD_STYLESHEET)
         self.setWizardStyle(QWizard.WizardStyle.ModernStyle)
         self.setMinimumSize(min_width, min_height)
         self.on_finish_callback = on_finish_callback
 
         # Set icon
-        if icon_path and Path(icon_path).exists():
-            self.setWindowIcon(QIcon(icon_path))
+        if icon_path and (icon := _load_icon(icon_path)) is not None:
+            self.setWindowIcon(icon)
 
         # Set logo
-        if logo_path and Path(logo_path).exists():
-            logo_pixmap = QPixmap(logo_path)
-            self.setPixmap(
-                QWizard.WizardPixmap.LogoPixmap,
-                logo_pixmap.scaled(
-                    60, 60,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-            )
+        if logo_path:
+            logo_pixmap = _cached_pixmap(logo_path, *_LOGO_SIZE)
+            if logo_pixmap is not None:
+                self.setPixmap(QWizard.WizardPixmap.LogoPixmap, logo_pixmap)
+            else:
+                self._logo_loaded.connect(self._apply_logo)
+                _get_image_executor().submit(self._load_logo, logo_path)
 
         # Add pages
         for page in pages:
@@ -250,16 +467,33 @@ class ConfigurableWizard(QWizard):
         if use_material_buttons:
             self._customize_buttons()
 
+    def _load_logo(self, path: str):
+        image = _read_scaled_image(path, *_LOGO_SIZE)
+        try:
+            self._logo_loaded.emit(path, image)
+        except RuntimeError:
+            pass  # wizard was deleted while the logo was loading
+
+    @pyqtSlot(str, QImage)
+    def _apply_logo(self, path: str, image: QImage):
+        if not image.isNull():
+            self.setPixmap(QWizard.WizardPixmap.LogoPixmap, _cache_scaled_pixmap(path, *_LOGO_SIZE, image))
+
     def _customize_buttons(self):
         """Replace default buttons with MaterialButtons."""
-        for button_type in [
-            QWizard.WizardButton.BackButton,
-            QWizard.WizardButton.NextButton,
-            QWizard.WizardButton.CancelButton,
-            QWizard.WizardButton.FinishButton
-        ]:
-            btn = self.button(button_type)
-            self.setButton(button_type, MaterialButton(btn.text()))
+        # Every setButton relayouts the button bar; repaint once after all four swaps
+        self.setUpdatesEnabled(False)
+        try:
+            for button_type in [
+                QWizard.WizardButton.BackButton,
+                QWizard.WizardButton.NextButton,
+                QWizard.WizardButton.CancelButton,
+                QWizard.WizardButton.FinishButton
+            ]:
+                btn = self.button(button_type)
+                self.setButton(button_type, MaterialButton(btn.text()))
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _on_finish(self):
         """Called when finish button is clicked."""
@@ -3,8 +3,9 @@ Tests for BasicDashboardAppWidget — Level 3 generic UI shell.
 Requires a QApplication (provided by pytest-qt via the qtbot fixture).
 """
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import patch
 
+import dashboard.app.BasicDashboardAppWidget as app_module
 from dashboard.app.BasicDashboardAppWidget import BasicDashboardAppWidget
 from dashboard.config import DashboardConfig
 
@@ -59,6 +60,13 @@ def test_action_signal_propagates(app_widget, qtbot):
     assert blocker.args == ["reset_errors"]
 
 
+def test_control_button_click_reaches_app_signal(app_widget, qtbot):
+    controls = app_widget._dashboard.control_buttons
+    controls.set_start_enabled(True)
+    with qtbot.waitSignal(app_widget.start_requested, timeout=500):
+        controls.start_btn.click()
+
+
 # ------------------------------------------------------------------ #
 #  Localization                                                        #
 # ------------------------------------------------------------------ #
@@ -72,19 +80,45 @@ def test_retranslate_emits_language_changed(app_widget, qtbot):
 #  Setter proxy API                                                    #
 # ------------------------------------------------------------------ #
 
-def test_set_cell_weight_delegates_to_dashboard(app_widget):
-    app_widget._dashboard = MagicMock()
+def _app_widget_with_mocked_setter(qtbot, name):
+    """Build the widget while *name* on its DashboardWidget class is an autospec'd mock."""
+    with patch.object(app_module.DashboardWidget, name, autospec=True) as setter:
+        widget = BasicDashboardAppWidget()
+    qtbot.addWidget(widget)
+    return widget, setter
+
+
+def test_set_cell_weight_delegates_to_dashboard(qtbot):
+    app_widget, setter = _app_widget_with_mocked_setter(qtbot, "set_cell_weight")
     app_widget.set_cell_weight(1, 2500.0)
-    app_widget._dashboard.set_cell_weight.assert_called_once_with(1, 2500.0)
+    setter.assert_called_once_with(app_widget._dashboard, 1, 2500.0)
 
 
-def test_set_cell_state_delegates_to_dashboard(app_widget):
-    app_widget._dashboard = MagicMock()
+def test_set_cell_state_delegates_to_dashboard(qtbot):
+    app_widget, setter = _app_widget_with_mocked_setter(qtbot, "set_cell_state")
     app_widget.set_cell_state(1, "ready")
-    app_widget._dashboard.set_cell_state.assert_called_once_with(1, "ready")
+    setter.assert_called_once_with(app_widget._dashboard, 1, "ready")
 
 
-def test_set_start_enabled_delegates_to_dashboard(app_widget):
-    app_widget._dashboard = MagicMock()
+def test_set_start_enabled_delegates_to_dashboard(qtbot):
+    app_widget, setter = _app_widget_with_mocked_setter(qtbot, "set_start_enabled")
     app_widget.set_start_enabled(True)
-    app_widget._dashboard.set_start_enabled.assert_called_once_with(True)
+    setter.assert_called_once_with(app_widget._dashboard, True)
+
+
+def test_subclass_override_of_a_setter_is_kept(qtbot):
+    class CustomAppWidget(BasicDashboardAppWidget):
+        def set_pause_text(self, text):
+            self.pause_text = text
+
+    app_widget = CustomAppWidget()
+    qtbot.addWidget(app_widget)
+    app_widget.set_pause_text("Resume")
+    assert app_widget.pause_text == "Resume"
+    assert app_widget._dashboard.control_buttons.pause_btn.text() != "Resume"
+
+
+def test_setters_are_bound_to_the_real_dashboard(app_widget):
+    assert app_widget.set_pause_text == app_widget._dashboard.set_pause_text
+    app_widget.set_start_enabled(False)
+    assert not app_widget._dashboard.control_buttons.start_btn.isEnabled()
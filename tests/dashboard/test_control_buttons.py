@@ -3,6 +3,7 @@ Tests for ControlButtonsWidget — pure UI widget, no broker knowledge.
 Requires a QApplication (provided by pytest-qt via the qtbot fixture).
 """
 import pytest
+from PyQt6.QtCore import QObject, pyqtSignal
 
 from dashboard.widgets.ControlButtonsWidget import ControlButtonsWidget
 
@@ -86,6 +87,25 @@ def test_set_pause_text(widget):
     assert widget.pause_btn.text() == "Resume"
 
 
+def test_setters_accept_loosely_typed_signals(widget):
+    class Adapter(QObject):
+        flag = pyqtSignal(object)
+        flag_int = pyqtSignal(int)
+        text = pyqtSignal(object)
+
+    adapter = Adapter()
+    adapter.flag.connect(widget.set_start_enabled)
+    adapter.flag_int.connect(widget.set_pause_enabled)
+    adapter.text.connect(widget.set_pause_text)
+
+    adapter.flag.emit(True)
+    adapter.flag_int.emit(1)
+    adapter.text.emit("Resume")
+    assert widget.start_btn.isEnabled()
+    assert widget.pause_btn.isEnabled()
+    assert widget.pause_btn.text() == "Resume"
+
+
 # ------------------------------------------------------------------ #
 #  Localization                                                        #
 # ------------------------------------------------------------------ #
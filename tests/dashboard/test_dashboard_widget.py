@@ -0,0 +1,219 @@
+"""
+Tests for DashboardWidget — pure UI facade, routes setter calls by card_id.
+Requires a QApplication (provided by pytest-qt via the qtbot fixture).
+"""
+import threading
+
+import pytest
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtWidgets import QWidget
+
+from dashboard.DashboardWidget import DashboardWidget
+from dashboard.config import ActionButtonConfig
+from dashboard.resources.styles import DASHBOARD_STYLESHEET
+
+
+class FakeCard(QWidget):
+    """Minimal card exposing the setter protocol DashboardWidget routes to."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def set_weight(self, grams):
+        self.calls.append(("weight", grams))
+
+    def set_state(self, state):
+        self.calls.append(("state", state))
+
+    def set_glue_type(self, glue_type):
+        self.calls.append(("glue_type", glue_type))
+
+
+# ------------------------------------------------------------------ #
+#  Fixtures                                                            #
+# ------------------------------------------------------------------ #
+
+@pytest.fixture
+def cards():
+    return {1: FakeCard(), 2: FakeCard()}
+
+
+@pytest.fixture
+def dashboard(qtbot, cards):
+    w = DashboardWidget(cards=[(card, card_id, None, None) for card_id, card in cards.items()])
+    qtbot.addWidget(w)
+    return w
+
+
+# ------------------------------------------------------------------ #
+#  Card routing                                                        #
+# ------------------------------------------------------------------ #
+
+def test_set_cell_weight_routes_to_card(dashboard, cards):
+    dashboard.set_cell_weight(2, 1250.0)
+    assert cards[2].calls == [("weight", 1250.0)]
+    assert cards[1].calls == []
+
+
+def test_set_cell_state_and_glue_type_route_to_card(dashboard, cards):
+    dashboard.set_cell_state(1, "ready")
+    dashboard.set_cell_glue_type(1, "Type A")
+    assert cards[1].calls == [("state", "ready"), ("glue_type", "Type A")]
+
+
+def test_cell_setters_accept_loosely_typed_signals(dashboard, cards):
+    class Adapter(QObject):
+        weight_object = pyqtSignal(int, object)
+        weight_int = pyqtSignal(int, int)
+        state_object = pyqtSignal(int, object)
+
+    adapter = Adapter()
+    adapter.weight_object.connect(dashboard.set_cell_weight)
+    adapter.weight_int.connect(dashboard.set_cell_weight)
+    adapter.state_object.connect(dashboard.set_cell_state)
+
+    adapter.weight_object.emit(1, 12.5)
+    adapter.weight_int.emit(1, 30)
+    adapter.state_object.emit(2, "ready")
+    assert cards[1].calls == [("weight", 12.5), ("weight", 30)]
+    assert cards[2].calls == [("state", "ready")]
+
+
+def test_unknown_card_id_is_ignored(dashboard, cards):
+    dashboard.set_cell_weight(99, 10.0)
+    assert all(not card.calls for card in cards.values())
+
+
+# ------------------------------------------------------------------ #
+#  Action buttons                                                      #
+# ------------------------------------------------------------------ #
+
+@pytest.fixture
+def action_dashboard(qtbot):
+    w = DashboardWidget(action_buttons=[ActionButtonConfig("reset_errors", "Reset"),
+                                        ActionButtonConfig("clean", "Clean")])
+    qtbot.addWidget(w)
+    return w
+
+
+def test_action_button_click_emits_its_action_id(action_dashboard, qtbot):
+    with qtbot.waitSignal(action_dashboard.action_requested, timeout=500) as blocker:
+        action_dashboard._action_buttons["clean"].click()
+    assert blocker.args == ["clean"]
+
+
+def test_set_action_button_enabled_and_text(action_dashboard):
+    action_dashboard.set_action_button_enabled("reset_errors", False)
+    action_dashboard.set_action_button_text("reset_errors", "Reset all")
+    btn = action_dashboard._action_buttons["reset_errors"]
+    assert not btn.isEnabled()
+    assert btn.text() == "Reset all"
+
+
+def test_value_setters_accept_loosely_typed_signals(action_dashboard):
+    class Adapter(QObject):
+        flag = pyqtSignal(object)
+        flag_int = pyqtSignal(int)
+        text = pyqtSignal(object)
+        action_flag = pyqtSignal(str, object)
+        action_text = pyqtSignal(str, object)
+
+    adapter = Adapter()
+    adapter.flag.connect(action_dashboard.set_start_enabled)
+    adapter.flag_int.connect(action_dashboard.set_stop_enabled)
+    adapter.text.connect(action_dashboard.set_pause_text)
+    adapter.action_flag.connect(action_dashboard.set_action_button_enabled)
+    adapter.action_text.connect(action_dashboard.set_action_button_text)
+
+    adapter.flag.emit(True)
+    adapter.flag_int.emit(1)
+    adapter.text.emit("Resume")
+    adapter.action_flag.emit("reset_errors", False)
+    adapter.action_text.emit("reset_errors", "Retry")
+
+    controls = action_dashboard.control_buttons
+    assert controls.start_btn.isEnabled() and controls.stop_btn.isEnabled()
+    assert controls.pause_btn.text() == "Resume"
+    button = action_dashboard._action_buttons["reset_errors"]
+    assert not button.isEnabled() and button.text() == "Retry"
+
+
+# ------------------------------------------------------------------ #
+#  Incremental relayout                                                #
+# ------------------------------------------------------------------ #
+
+def test_add_card_rebuilds_only_the_card_grid(dashboard):
+    manager = dashboard.layout_manager
+    preview, actions = manager._preview_container, manager._action_container
+    old_cards = manager._cards_container
+
+    card = FakeCard()
+    dashboard.add_card(card, 3)
+
+    assert manager._cards_container is not old_cards
+    assert card.parentWidget() is manager._cards_container
+    assert manager._preview_container is preview
+    assert manager._action_container is actions
+
+    dashboard.set_cell_state(3, "ready")
+    assert card.calls == [("state", "ready")]
+
+
+def test_card_without_setters_is_accepted(qtbot):
+    plain = QWidget()
+    w = DashboardWidget(cards=[(plain, 1, None, None)])
+    qtbot.addWidget(w)
+    w.set_cell_weight(1, 5.0)  # no set_weight on the card: silently ignored
+
+
+# ------------------------------------------------------------------ #
+#  Trajectory point coalescing                                         #
+# ------------------------------------------------------------------ #
+
+def _trail(dashboard):
+    return dashboard.trajectory_widget.trajectory_manager.get_trajectory_copy()
+
+
+def test_trajectory_points_are_delivered_in_one_batch(dashboard, qtbot):
+    for x in (10, 20, 30):
+        dashboard.update_trajectory_point({"x": x, "y": 5})
+    assert _trail(dashboard) == []
+
+    qtbot.waitUntil(lambda: len(_trail(dashboard)) > 0, timeout=500)
+    assert dashboard._point_buffer == []
+    assert _trail(dashboard)[-1][:2] == (30, 5)
+
+
+def test_trajectory_points_from_worker_thread_are_delivered(dashboard, qtbot):
+    def produce():
+        for i in range(20):
+            dashboard.update_trajectory_point({"x": 10 + i, "y": 5})
+
+    worker = threading.Thread(target=produce)
+    worker.start()
+    worker.join()
+
+    qtbot.waitUntil(lambda: len(_trail(dashboard)) == 20, timeout=1000)
+    assert dashboard._point_buffer == []
+    assert _trail(dashboard)[-1][:2] == (29, 5)
+
+
+def test_break_flushes_buffered_points_first(dashboard):
+    dashboard.update_trajectory_point({"x": 10, "y": 10})
+    dashboard.break_trajectory()
+    dashboard.update_trajectory_point({"x": 200, "y": 200})
+    dashboard._flush_points()
+
+    trail = _trail(dashboard)
+    assert trail[0][:2] == (10, 10)
+    # The point after the break starts a new segment instead of being joined to (10, 10)
+    assert trail[-1][:2] == (200, 200) and trail[-1][3] is True
+    assert len(trail) == 2
+
+
+def test_dashboard_stylesheet_applied_once_at_top(qtbot):
+    widget = DashboardWidget()
+    qtbot.addWidget(widget)
+    assert widget.styleSheet() == DASHBOARD_STYLESHEET
+    assert widget.trajectory_widget.image_label.styleSheet() == ""
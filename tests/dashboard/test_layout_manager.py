@@ -0,0 +1,178 @@
+"""
+Tests for DashboardLayoutManager — grid placement of cards, action buttons
+and placeholders.
+Requires a QApplication (provided by pytest-qt via the qtbot fixture).
+"""
+import pytest
+from PyQt6.QtWidgets import QWidget, QPushButton
+
+from dashboard.config import DashboardConfig
+from dashboard.layout.layout_manager import DashboardLayoutManager
+
+
+def _positions(container: QWidget) -> dict:
+    """Map each widget in *container*'s grid to its (row, col, row_span, col_span)."""
+    grid = container.layout()
+    return {
+        grid.itemAt(i).widget(): grid.getItemPosition(i)
+        for i in range(grid.count())
+        if grid.itemAt(i).widget() is not None
+    }
+
+
+def _placeholder_cells(container: QWidget) -> list:
+    """Return the sorted (row, col) cells reserved for painted placeholders."""
+    grid = container.layout()
+    return sorted(
+        grid.getItemPosition(i)[:2]
+        for i in range(grid.count())
+        if grid.itemAt(i).spacerItem() is not None
+    )
+
+
+@pytest.fixture
+def make_manager(qtbot):
+    def _make(**config_overrides):
+        parent = QWidget()
+        qtbot.addWidget(parent)
+        return DashboardLayoutManager(parent, DashboardConfig(**config_overrides))
+    return _make
+
+
+# ------------------------------------------------------------------ #
+#  Action grid                                                         #
+# ------------------------------------------------------------------ #
+
+def test_action_buttons_auto_fill_row_major(make_manager):
+    manager = make_manager(action_grid_rows=2, action_grid_cols=2, show_placeholders=False)
+    a, b, c = QPushButton("a"), QPushButton("b"), QPushButton("c")
+
+    container = manager._create_action_grid([(a, None, None, 1, 1),
+                                             (b, None, None, 1, 1),
+                                             (c, None, None, 1, 1)])
+
+    positions = _positions(container)
+    assert positions[a] == (0, 0, 1, 1)
+    assert positions[b] == (0, 1, 1, 1)
+    assert positions[c] == (1, 0, 1, 1)
+
+
+def test_action_buttons_skip_cells_a_span_does_not_fit(make_manager):
+    manager = make_manager(action_grid_rows=2, action_grid_cols=2, show_placeholders=False)
+    single, wide, filler = QPushButton("single"), QPushButton("wide"), QPushButton("filler")
+
+    container = manager._create_action_grid([(single, None, None, 1, 1),
+                                             (wide, None, None, 1, 2),
+                                             (filler, None, None, 1, 1)])
+
+    positions = _positions(container)
+    assert positions[single] == (0, 0, 1, 1)
+    assert positions[wide] == (1, 0, 1, 2)
+    # The gap left at (0, 1) is still used by a later single-cell button
+    assert positions[filler] == (0, 1, 1, 1)
+
+
+def test_explicit_positions_are_respected_and_gaps_get_placeholders(make_manager):
+    manager = make_manager(action_grid_rows=2, action_grid_cols=2, show_placeholders=True)
+    pinned, auto = QPushButton("pinned"), QPushButton("auto")
+
+    container = manager._create_action_grid([(auto, None, None, 1, 1),
+                                             (pinned, 0, 0, 1, 1)])
+
+    positions = _positions(container)
+    assert positions[pinned] == (0, 0, 1, 1)
+    assert positions[auto] == (0, 1, 1, 1)
+    assert len(positions) == 2
+    assert _placeholder_cells(container) == [(1, 0), (1, 1)]
+
+
+# ------------------------------------------------------------------ #
+#  Complete layout                                                     #
+# ------------------------------------------------------------------ #
+
+def test_complete_layout_is_one_grid(make_manager):
+    manager = make_manager(show_placeholders=False)
+    trajectory, controls = QWidget(), QWidget()
+    manager.setup_complete_layout(trajectory, [], controls, [])
+
+    grid = manager.parent.layout()
+    positions = _positions(manager.parent)
+    assert positions[manager._preview_container] == (0, 0, 1, 1)
+    assert positions[manager._cards_container] == (0, 1, 1, 1)
+    bottom_row = grid.itemAtPosition(1, 0).layout()
+    assert grid.getItemPosition(grid.indexOf(bottom_row)) == (1, 0, 1, 2)
+    assert [bottom_row.itemAt(i).widget() for i in range(bottom_row.count())] == [
+        manager._action_container, controls]
+
+
+def test_bottom_row_is_split_evenly_and_fixed_height_on_wide_windows(make_manager, qtbot):
+    manager = make_manager(show_placeholders=False, bottom_section_height=300)
+    controls = QWidget()
+    manager.setup_complete_layout(QWidget(), [], controls, [])
+    parent = manager.parent
+
+    for width, height in ((1920, 1080), (2560, 1600)):
+        parent.resize(width, height)
+        parent.show()
+        qtbot.waitExposed(parent)
+        actions = manager._action_container
+
+        assert manager._cards_container.width() == 450
+        assert abs(actions.width() - controls.width()) <= 1
+        assert actions.height() == controls.height() == 300
+
+
+# ------------------------------------------------------------------ #
+#  Incremental relayout                                                #
+# ------------------------------------------------------------------ #
+
+def test_invalidate_rejects_unknown_section(make_manager):
+    with pytest.raises(ValueError):
+        make_manager().invalidate("footer")
+
+
+def test_rebuilt_action_grid_takes_the_old_bottom_row_slot(make_manager):
+    manager = make_manager(show_placeholders=False)
+    controls = QWidget()
+    manager.setup_complete_layout(QWidget(), [], controls, [])
+    old = manager._action_container
+
+    manager.set_action_buttons([(QPushButton("Go"), None, None, 1, 1)])
+    manager.update_layout()
+
+    bottom_row = manager.parent.layout().itemAtPosition(1, 0).layout()
+    assert manager._action_container is not old
+    assert bottom_row.itemAt(0).widget() is manager._action_container
+    assert bottom_row.itemAt(1).widget() is controls
+
+
+# ------------------------------------------------------------------ #
+#  Preview aux grid                                                    #
+# ------------------------------------------------------------------ #
+
+def test_preview_aux_placeholders_are_a_single_widget(make_manager):
+    manager = make_manager(preview_aux_rows=2, preview_aux_cols=3, show_placeholders=True)
+    container = manager._create_preview_aux_grid()
+    assert container.findChildren(QWidget) == []
+    assert len(_placeholder_cells(container)) == 6
+
+
+def test_empty_card_cells_are_painted_not_widgets(make_manager, qtbot):
+    manager = make_manager(card_grid_rows=3, card_grid_cols=1, show_placeholders=True)
+    card = QWidget()
+    container = manager._create_glue_cards_container([(card, None, None)])
+    qtbot.addWidget(container)
+
+    assert container.findChildren(QWidget) == [card]
+    assert _placeholder_cells(container) == [(1, 0), (2, 0)]
+    container.resize(300, 300)
+    assert not container.grab().isNull()
+    assert container.minimumSizeHint().height() > 0
+
+
+def test_dashboard_config_is_immutable():
+    import dataclasses
+    config = DashboardConfig()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.show_placeholders = False
+    assert dataclasses.replace(config, show_placeholders=False).show_placeholders is False
@@ -0,0 +1,313 @@
+"""
+Tests for RobotTrajectoryWidget — background frame handling and trail drawing.
+Requires a QApplication (provided by pytest-qt via the qtbot fixture).
+"""
+import numpy as np
+import pytest
+
+from dashboard.widgets.RobotTrajectoryWidget import (
+    _TRAIL_BAND_THICKNESS, _TRAIL_BANDS, FrameRenderer, RobotTrajectoryWidget, TrajectoryManager, _draw_gradient_polyline,
+    _smooth_points, draw_icon_at_position,
+)
+
+
+# ------------------------------------------------------------------ #
+#  Fixture                                                             #
+# ------------------------------------------------------------------ #
+
+@pytest.fixture
+def widget(qtbot):
+    w = RobotTrajectoryWidget(image_width=160, image_height=90)
+    qtbot.addWidget(w)
+    return w
+
+
+def _frame(value: int, width: int = 320, height: int = 180) -> np.ndarray:
+    return np.full((height, width, 3), value, dtype=np.uint8)
+
+
+# ------------------------------------------------------------------ #
+#  set_image                                                           #
+# ------------------------------------------------------------------ #
+
+def test_set_image_resizes_to_widget_dimensions(widget, qtbot):
+    widget.set_image({"image": _frame(120)})
+    qtbot.waitUntil(lambda: int(widget.base_frame[0, 0, 0]) == 120, timeout=1000)
+    assert widget.base_frame.shape == (90, 160, 3)
+
+
+def test_latest_image_wins(widget, qtbot):
+    widget.set_image({"image": _frame(10)})
+    widget.set_image({"image": _frame(200)})
+    qtbot.waitUntil(lambda: int(widget.base_frame[0, 0, 0]) == 200, timeout=1000)
+    qtbot.wait(50)
+    assert int(widget.base_frame[0, 0, 0]) == 200
+
+
+def test_set_image_none_restores_placeholder(widget, qtbot):
+    widget.set_image({"image": _frame(120)})
+    widget.set_image({"image": None})
+    qtbot.wait(50)
+    assert widget.base_frame.shape == (90, 160, 3)
+    assert int(widget.base_frame.max()) == 0
+
+
+def test_placeholder_file_is_decoded_once(qtbot, tmp_path, monkeypatch):
+    import cv2
+    from dashboard.widgets import RobotTrajectoryWidget as module
+    path = str(tmp_path / "placeholder.png")
+    cv2.imwrite(path, _frame(70, 40, 20))
+    monkeypatch.setattr(module, "CAMERA_PREVIEW_PLACEHOLDER", path)
+    reads = []
+    imread = cv2.imread
+    monkeypatch.setattr(cv2, "imread", lambda *args: reads.append(args) or imread(*args))
+
+    for _ in range(2):
+        w = RobotTrajectoryWidget(image_width=160, image_height=90)
+        qtbot.addWidget(w)
+        w.set_image({"image": None})
+    qtbot.waitUntil(lambda: w.base_frame is not None and int(w.base_frame[0, 0, 0]) == 70, timeout=1000)
+
+    assert len(reads) == 1
+
+
+def test_stale_failed_resize_does_not_replace_a_newer_frame(widget, qtbot, monkeypatch):
+    widget.set_image({"image": _frame(10)})
+    stale = widget._background_request
+    widget.set_image({"image": _frame(200)})
+    qtbot.waitUntil(lambda: int(widget.base_frame[0, 0, 0]) == 200, timeout=1000)
+    placeholders = []
+    monkeypatch.setattr(widget, "load_placeholder_image", lambda: placeholders.append(True))
+
+    # The older frame's resize fails only after the newer frame was adopted
+    widget._renderer.background_changed.emit(stale, None)
+    assert placeholders == []
+    assert int(widget.base_frame[0, 0, 0]) == 200
+
+    widget._renderer.background_changed.emit(widget._background_request, None)
+    assert placeholders == [True]
+
+
+def test_set_image_clears_trail(widget):
+    widget.update_trajectory_point({"x": 5, "y": 5})
+    widget.set_image({"image": _frame(120)})
+    assert widget.trajectory_manager.get_trajectory_copy() == []
+
+
+# ------------------------------------------------------------------ #
+#  Display updates                                                     #
+# ------------------------------------------------------------------ #
+
+def test_idle_tick_does_not_redraw(widget):
+    widget.update_display()
+    key = widget.image_label.pixmap().cacheKey()
+    widget.update_display()
+    assert widget.image_label.pixmap().cacheKey() == key
+
+
+def test_renderer_restores_trail_box_when_trail_is_cleared(qtbot):
+    renderer = FrameRenderer(160, 90)
+    renderer.set_background(_frame(40, 160, 90))
+    points = np.array([(x, 30 + x // 4) for x in range(20, 120, 10)], dtype=np.int32)
+
+    renderer.render((points, np.zeros(len(points), dtype=bool)))
+    assert not np.array_equal(renderer._canvas, renderer._base)
+
+    renderer.render(None)
+    assert np.array_equal(renderer._canvas, renderer._base)
+
+
+def test_renderer_reuses_its_canvas_for_a_new_background(qtbot):
+    renderer = FrameRenderer(160, 90)
+    renderer.set_background(_frame(40, 160, 90))
+    renderer.render(None)
+    canvas = renderer._canvas
+
+    renderer.set_background(_frame(90, 160, 90))
+    image = renderer.render(None)
+
+    assert renderer._canvas is canvas
+    assert np.array_equal(canvas, renderer._base)
+    assert image.pixelColor(0, 0).red() == 90
+
+
+def test_rendering_happens_off_the_gui_thread(widget, qtbot, monkeypatch):
+    import threading
+    threads = []
+    render = FrameRenderer.render
+    monkeypatch.setattr(FrameRenderer, "render",
+                        lambda self, trail: (threads.append(threading.current_thread()), render(self, trail))[1])
+
+    widget.enable_drawing()
+    with qtbot.waitSignal(widget._renderer.rendered, timeout=1000):
+        widget.update_trajectory_point({"x": 5, "y": 5})
+    assert threads and threading.main_thread() not in threads
+
+
+def test_redraw_timer_only_runs_after_new_data(widget, qtbot):
+    widget.enable_drawing()
+    qtbot.waitUntil(lambda: not widget.timer.isActive(), timeout=1000)
+    qtbot.wait(60)
+    assert not widget.timer.isActive()
+
+    widget.update_trajectory_point({"x": 5, "y": 5})
+    assert widget.timer.isActive()
+    qtbot.waitUntil(lambda: not widget._dirty, timeout=1000)
+
+
+def test_points_do_not_redraw_while_drawing_is_disabled(widget, qtbot):
+    qtbot.waitUntil(lambda: not widget.timer.isActive(), timeout=1000)
+    widget.update_trajectory_point({"x": 5, "y": 5})
+    widget.break_trajectory()
+    assert not widget._dirty
+    assert not widget.timer.isActive()
+
+
+def test_metric_values_reach_the_labels_while_idle(widget, qtbot):
+    qtbot.waitUntil(lambda: not widget.timer.isActive(), timeout=1000)
+    widget.estimated_time_value = 12.5
+    widget.time_left_value = 3.25
+
+    qtbot.waitUntil(lambda: widget.estimated_metric.value_label.text() == "12.50 s", timeout=500)
+    assert widget.time_left_metric.value_label.text() == "3.25 s"
+    assert not widget._dirty
+
+
+def test_max_redraw_rate_spaces_out_draws(widget, qtbot):
+    widget.enable_drawing()
+    qtbot.waitUntil(lambda: not widget.timer.isActive(), timeout=1000)
+    widget.set_max_redraw_rate(5)
+    widget.update_display()
+    widget.update_trajectory_point({"x": 5, "y": 5})
+    assert widget.timer.remainingTime() > 100
+
+    with pytest.raises(ValueError):
+        widget.set_max_redraw_rate(0)
+
+
+# ------------------------------------------------------------------ #
+#  TrajectoryManager                                                   #
+# ------------------------------------------------------------------ #
+
+def test_trajectory_snapshot_keeps_the_last_trail_length_points():
+    manager = TrajectoryManager(trail_length=5)
+    manager.interpolate_motion = False
+    for i in range(3):
+        manager.update_position((i, i))
+    assert [p[0] for p in manager.get_trajectory_copy()] == [0, 1, 2]
+    for i in range(3, 8):
+        manager.update_position((i, i))
+    assert [p[0] for p in manager.get_trajectory_copy()] == [3, 4, 5, 6, 7]
+
+
+def test_snapshot_returns_wrapped_ring_oldest_first():
+    manager = TrajectoryManager(trail_length=4)
+    manager.interpolate_motion = False
+    for i in range(6):
+        manager.update_position((i, 10 * i))
+    manager.break_trajectory()
+    manager.update_position((6, 60))
+
+    points, breaks, _ = manager.snapshot()
+
+    assert points.dtype == np.int32
+    assert points.tolist() == [[3, 30], [4, 40], [5, 50], [6, 60]]
+    assert breaks.tolist() == [False, False, False, True]
+
+
+def test_interpolation_fills_only_moves_longer_than_five_pixels():
+    manager = TrajectoryManager(trail_length=20)
+    manager.update_position((0, 0))
+    manager.update_position((3, 4))
+    manager.update_position((11, -4))
+
+    points, _, _ = manager.snapshot()
+
+    assert points.tolist() == [[0, 0], [3, 4], [5, 2], [7, 0], [9, -2], [11, -4]]
+
+
+def test_snapshot_smoothing_matches_smoothing_each_segment():
+    rng = np.random.default_rng(3)
+    manager = TrajectoryManager(trail_length=12)
+    manager.interpolate_motion = False
+    for step in range(60):
+        if rng.random() < 0.1:
+            manager.break_trajectory()
+        manager.update_position(tuple(rng.integers(0, 100, 2).tolist()))
+        if step % 4 == 0:
+            points, breaks, smoothed = manager.snapshot()
+            segments = np.split(points, np.flatnonzero(breaks))
+            expected = np.concatenate([_smooth_points(segment) for segment in segments])
+            assert np.array_equal(smoothed, expected)
+
+
+def test_clear_trail_drops_points_added_before_it():
+    manager = TrajectoryManager(trail_length=5)
+    manager.update_position((1, 1))
+    manager.get_trajectory_copy()
+    manager.update_position((2, 2))
+    manager.clear_trail()
+    manager.update_position((9, 9))
+    assert [p[:2] for p in manager.get_trajectory_copy()] == [(9, 9)]
+
+
+# ------------------------------------------------------------------ #
+#  Drawing helpers                                                     #
+# ------------------------------------------------------------------ #
+
+def test_draw_icon_blends_rgba_icon_over_image():
+    rng = np.random.default_rng(0)
+    icon = rng.integers(0, 256, (6, 8, 4), dtype=np.uint8)
+    image = rng.integers(0, 256, (20, 20, 3), dtype=np.uint8)
+    expected = image.copy()
+    alpha = icon[:, :, 3:4] / 255.0
+    expected[7:13, 6:14] = alpha * icon[:, :, :3] + (1 - alpha) * expected[7:13, 6:14]
+
+    draw_icon_at_position(icon, image, (10, 10))
+
+    assert np.abs(image.astype(int) - expected.astype(int)).max() <= 1
+
+
+def test_smooth_points_is_a_trailing_three_point_mean():
+    points = np.array([[0, 0], [3, 6], [6, 3], [9, 9], [10, 0]], dtype=np.float32)
+    smoothed = _smooth_points(points)
+    expected = [(int(np.mean(points[max(0, i - 2):i + 1, 0])), int(np.mean(points[max(0, i - 2):i + 1, 1])))
+                for i in range(len(points))]
+    assert [tuple(p) for p in smoothed.tolist()] == expected
+
+
+def test_gradient_polyline_skips_segments_leaving_the_image():
+    image = np.zeros((50, 100, 3), dtype=np.uint8)
+    points = np.array([[10, 10], [40, 10], [120, 40], [60, 40], [90, 40]], dtype=np.int32)
+    _draw_gradient_polyline(image, points)
+
+    assert image[10, 20:30].any()           # first segment is inside
+    assert not image[25, 80:100].any()      # segments touching x=120 are skipped
+    assert image[40, 70:80].any()           # drawing resumes after the gap
+
+
+def test_band_thickness_matches_the_per_segment_formula():
+    for total in (2, 7, 20, 41, 100):
+        for i in range(total - 1):
+            progress = (i + 1) / total
+            band = ((i + 1) * _TRAIL_BANDS) // total
+            assert _TRAIL_BAND_THICKNESS[band] == max(1, int(2 + (progress * 4))), (total, i)
+
+
+def test_newest_band_is_the_thickest():
+    total = 100
+    newest_band = ((total - 1) * _TRAIL_BANDS) // total
+    assert _TRAIL_BAND_THICKNESS[newest_band] == max(1, int(2 + ((total - 1) / total * 4)))
+    assert _TRAIL_BAND_THICKNESS[newest_band] == max(_TRAIL_BAND_THICKNESS)
+
+
+def test_label_shows_frame_colours_in_rgb_order(widget, qtbot):
+    frame = np.zeros((90, 160, 3), dtype=np.uint8)
+    frame[:, :] = (255, 0, 0)  # pure blue in BGR
+    widget.set_image({"image": frame})
+
+    def label_is_blue():
+        pixel = widget.image_label.pixmap().toImage().pixelColor(5, 5)
+        return (pixel.red(), pixel.green(), pixel.blue()) == (0, 0, 255)
+
+    qtbot.waitUntil(label_is_blue, timeout=1000)
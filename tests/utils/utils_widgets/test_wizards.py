@@ -0,0 +1,200 @@
+"""Tests for src.utils.utils_widgets.wizards — lazily built wizard steps."""
+
+from PyQt6.QtWidgets import QLineEdit, QWizard
+
+from src.utils.utils_widgets.wizards import (
+    ConfigurableWizard,
+    GenericWizardStep,
+    SelectionStep,
+    SummaryStep,
+    WizardStepConfig,
+)
+
+
+def _config(**kwargs):
+    return WizardStepConfig(title="Pick", subtitle="sub", description="desc", **kwargs)
+
+
+# ── WizardStepConfig ──────────────────────────────────────────────────
+
+class TestWizardStepConfig:
+    def test_full_title_without_step_number(self):
+        assert _config().full_title == "Pick"
+
+    def test_full_title_with_step_number(self):
+        assert _config(step_number=2).full_title == "Step 2: Pick"
+
+    def test_config_is_hashable(self):
+        assert hash(_config(step_number=1)) == hash(_config(step_number=1))
+
+
+# ── GenericWizardStep ─────────────────────────────────────────────────
+
+class _NameStep(GenericWizardStep):
+    """A step written the usual way: content added and fields registered in ``__init__``."""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.name_edit = QLineEdit()
+        self.content_layout.addWidget(self.name_edit)
+        self.registerField("name*", self.name_edit)
+
+
+class TestGenericWizardStep:
+    def test_mandatory_field_registered_in_init_gates_completion(self, qapp):
+        step = _NameStep(_config())
+        wizard = ConfigurableWizard("Setup", [step, GenericWizardStep(_config())], use_material_buttons=False)
+        wizard.restart()
+
+        assert not step.isComplete()
+        step.name_edit.setText("x")
+        assert step.isComplete()
+        assert wizard.field("name") == "x"
+
+    def test_content_added_in_init_sits_below_the_description(self, qapp):
+        step = _NameStep(_config())
+        step.initializePage()
+        layout = step.layout()
+
+        assert layout.indexOf(step.image_label) == 0
+        assert layout.indexOf(step.name_edit) == 2
+        assert layout.itemAt(layout.count() - 1).spacerItem() is not None
+
+
+# ── SelectionStep ─────────────────────────────────────────────────────
+
+class TestSelectionStep:
+    def test_page_is_built_on_first_show(self, qapp):
+        step = SelectionStep(_config(), ["a", "b"])
+        assert not hasattr(step, "image_label")
+
+        step.initializePage()
+        assert step.button_group is not None
+        assert len(step.button_group.buttons()) == 2
+
+    def test_default_option_before_build(self, qapp):
+        step = SelectionStep(_config(), ["a", "b"])
+        assert step.get_selected_option() == "a"
+
+    def test_selected_option_follows_checked_button(self, qapp):
+        step = SelectionStep(_config(), ["a", "b"])
+        step.initializePage()
+        step.button_group.button(1).setChecked(True)
+        assert step.get_selected_option() == "b"
+
+    def test_radio_buttons_share_one_font(self, qapp):
+        step = SelectionStep(_config(), ["a", "b"])
+        step.initializePage()
+        first, second = step.button_group.buttons()
+
+        assert first.font() == second.font()
+        assert first.font().pixelSize() == 14
+
+    def test_empty_options_have_no_selection(self, qapp):
+        step = SelectionStep(_config(), [])
+        assert step.get_selected_option() is None
+
+        step.initializePage()
+        assert step.button_group is None
+        assert step.get_selected_option() is None
+
+    def test_empty_options_error_label_styled_without_stylesheet(self, qapp):
+        from PyQt6.QtGui import QPalette
+        from PyQt6.QtWidgets import QLabel
+        from src.utils.utils_widgets import wizards
+
+        step = SelectionStep(_config(), [])
+        step.initializePage()
+        error_label = step.findChild(QLabel, wizards._ERROR_LABEL_NAME)
+
+        assert error_label.styleSheet() == ""
+        assert error_label.font().bold()
+        assert error_label.palette().color(QPalette.ColorRole.WindowText).name() == wizards.STATUS_ERROR.lower()
+
+
+# ── SummaryStep ───────────────────────────────────────────────────────
+
+class TestSummaryStep:
+    def test_summary_generated_when_shown(self, qapp):
+        step = SummaryStep(_config(), summary_generator=lambda wizard: "<b>done</b>")
+        wizard = ConfigurableWizard("Setup", [step], use_material_buttons=False)
+        wizard.restart()
+
+        assert step.summary_text.text() == "<b>done</b>"
+
+    def test_summary_regenerated_only_when_tracked_field_changes(self, qapp):
+        calls = []
+
+        def generate(wizard):
+            calls.append(wizard.field("name"))
+            return f"<b>{wizard.field('name')}</b>"
+
+        first = GenericWizardStep(_config())
+        name_edit = QLineEdit("a", first)
+        first.registerField("name", name_edit)
+        summary = SummaryStep(_config(), summary_generator=generate, tracked_fields=["name"])
+        wizard = ConfigurableWizard("Setup", [first, summary], use_material_buttons=False)
+        wizard.restart()
+
+        wizard.next()
+        wizard.back()
+        wizard.next()
+        assert calls == ["a"]
+
+        wizard.back()
+        name_edit.setText("b")
+        wizard.next()
+        assert calls == ["a", "b"]
+        assert summary.summary_text.text() == "<b>b</b>"
+
+    def test_summary_without_tracked_fields_regenerated_every_time(self, qapp):
+        calls = []
+        step = SummaryStep(_config(), summary_generator=lambda wizard: calls.append(1) or "done")
+        wizard = ConfigurableWizard("Setup", [step], use_material_buttons=False)
+        wizard.restart()
+        wizard.restart()
+
+        assert len(calls) == 2
+
+
+# ── ConfigurableWizard ────────────────────────────────────────────────
+
+class TestConfigurableWizard:
+    def test_material_buttons_replace_defaults(self, qapp):
+        from src.utils.utils_widgets.MaterialButton import MaterialButton
+
+        wizard = ConfigurableWizard("Setup", [SelectionStep(_config(), ["a"])])
+        assert isinstance(wizard.button(QWizard.WizardButton.NextButton), MaterialButton)
+
+    def test_step_images_share_cached_pixmap(self, qapp, tmp_icon_file):
+        first = SelectionStep(_config(image_path=tmp_icon_file), ["a"])
+        second = SelectionStep(_config(image_path=tmp_icon_file), ["a"])
+        first.initializePage()
+        second.initializePage()
+
+        assert first.image_label.pixmap().cacheKey() == second.image_label.pixmap().cacheKey()
+
+    def test_logo_is_applied_after_background_load(self, qapp, qtbot, tmp_icon_file):
+        wizard = ConfigurableWizard("Setup", [], logo_path=tmp_icon_file, use_material_buttons=False)
+
+        qtbot.waitUntil(lambda: not wizard.pixmap(QWizard.WizardPixmap.LogoPixmap).isNull())
+
+
+# ── Pixmap cache ──────────────────────────────────────────────────────
+
+class TestPixmapCache:
+    def test_cache_keeps_only_the_most_recently_used_pixmaps(self, qapp, monkeypatch):
+        from collections import OrderedDict
+        from PyQt6.QtGui import QImage
+        from src.utils.utils_widgets import wizards
+
+        monkeypatch.setattr(wizards, "_pixmap_cache", OrderedDict())
+        monkeypatch.setattr(wizards, "_PIXMAP_CACHE_SIZE", 2)
+        image = QImage(4, 4, QImage.Format.Format_RGB32)
+
+        wizards._cache_scaled_pixmap("a.png", 4, 4, image)
+        wizards._cache_scaled_pixmap("b.png", 4, 4, image)
+        wizards._cached_pixmap("a.png", 4, 4)
+        wizards._cache_scaled_pixmap("c.png", 4, 4, image)
+
+        assert list(wizards._pixmap_cache) == [("a.png", 4, 4), ("c.png", 4, 4)]